@@ -13,6 +13,7 @@ from .resilience_tools import (
     expo,
     fibo,
     constant,
+    wait_times_bulk,
     circuit_breaker,
     CircuitBreaker,
     CircuitState,
@@ -26,6 +27,7 @@ __all__ = [
     'expo',
     'fibo',
     'constant',
+    'wait_times_bulk',
 
     # Circuit breaking
     'circuit_breaker',
@@ -18,10 +18,17 @@ import logging
 from typing import Optional, Callable, Any
 from functools import wraps
 import asyncio
+import math
 import time
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Try to import backoff library
 try:
     import backoff
@@ -52,6 +59,39 @@ except ImportError:
         return lambda n: interval
 
 
+def wait_times_bulk(n: int, wait_gen: str = 'expo', max_value: float = 60, interval: float = 1):
+    """
+    Wait times for tries 0..n-1 in one call (a float array; a list
+    without numpy), following the fallback expo/fibo/constant curves.
+
+    Args:
+        n: Number of tries
+        wait_gen: 'expo' (2**i), 'fibo' (Fibonacci) or 'constant'
+        max_value: Cap applied to expo and fibo waits
+        interval: Wait for 'constant'
+    """
+    # Every curve is a short uncapped prefix followed by a constant tail
+    if wait_gen == 'constant':
+        prefix, tail = [], interval
+    elif wait_gen == 'expo':
+        uncapped = min(n, int(math.log2(max_value)) + 1) if max_value >= 1 else 0
+        prefix, tail = [min(2.0 ** i, max_value) for i in range(uncapped)], max_value
+    elif wait_gen == 'fibo':
+        prefix, tail = [], max_value
+        a, b = 0, 1
+        while len(prefix) < n and a < max_value:
+            prefix.append(a)
+            a, b = b, a + b
+    else:
+        raise ValueError(f"Unknown wait generator: {wait_gen}")
+
+    if NUMPY_AVAILABLE:
+        waits = np.full(n, tail, dtype=float)
+        waits[:len(prefix)] = prefix
+        return waits
+    return [float(w) for w in prefix] + [float(tail)] * (n - len(prefix))
+
+
 # Simplified circuit breaker implementation (fallback)
 class CircuitState:
     """Circuit breaker states"""
@@ -278,6 +318,7 @@ __all__ = [
     'expo',
     'fibo',
     'constant',
+    'wait_times_bulk',
     'circuit_breaker',
     'CircuitBreaker',
     'CircuitState',
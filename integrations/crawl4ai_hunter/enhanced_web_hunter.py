@@ -9,6 +9,7 @@ Rose Glass dimensional tracking integrated.
 """
 
 import asyncio
+import json
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -31,7 +32,7 @@ except ImportError:
     CRAWL4AI_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HuntResult:
     """
     Result from web hunting operation.
@@ -105,23 +106,73 @@ class EnhancedWebHunter:
         self.hunts_completed = 0
         self.total_leads_found = 0
 
+        # Crawl configs (extraction strategy included) built once per
+        # schema + extraction mode instead of once per URL
+        self._run_configs: Dict[tuple, Any] = {}
+
+        # Browser kept open across hunts by start() / ``async with``;
+        # without it each hunt_leads call launches and closes its own.
+        # Shared hunters count their start() calls; the last close() shuts it.
+        self._crawler = None
+        self._users = 0
+
+    async def start(self) -> 'EnhancedWebHunter':
+        """
+        Launch the browser once and reuse it for every hunt until close().
+
+        Each start() must be paired with a close(); the browser stays open
+        until the last of them.
+        """
+        self._users += 1
+        if self._crawler is None:
+            crawler = AsyncWebCrawler(config=self.browser_config)
+            try:
+                await crawler.__aenter__()
+            except BaseException:
+                self._users -= 1
+                raise
+            self._crawler = crawler
+        return self
+
+    async def close(self):
+        """Release one start(); the last release shuts down the browser (if open)"""
+        if self._users > 0:
+            self._users -= 1
+            if self._users:
+                return
+        if self._crawler is not None:
+            crawler, self._crawler = self._crawler, None
+            await crawler.__aexit__(None, None, None)
+
+    async def __aenter__(self) -> 'EnhancedWebHunter':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     async def hunt_leads(
         self,
         urls: List[str],
         extraction_schema: Dict[str, Any],
         use_llm: bool = False,
         llm_provider: str = "openai/gpt-4o-mini",
-        llm_instruction: Optional[str] = None
+        llm_instruction: Optional[str] = None,
+        max_concurrent: int = 5
     ) -> List[HuntResult]:
         """
         Hunt leads from multiple URLs.
 
+        URLs share one browser (the persistent one if the hunter was
+        started) and are crawled concurrently, at most ``max_concurrent``
+        at a time; results come back in ``urls`` order.
+
         Args:
             urls: Target URLs to hunt
             extraction_schema: CSS/JSON schema for extraction
             use_llm: Use LLM-powered extraction (requires API key)
             llm_provider: LLM model for extraction
             llm_instruction: Custom instructions for LLM
+            max_concurrent: Maximum pages crawled at once
 
         Returns:
             List of HuntResult with extracted leads and Rose Glass scores
@@ -135,32 +186,21 @@ class EnhancedWebHunter:
             >>> for result in results:
             ...     print(f"Found {result.leads_found} leads (C={result.coherence_score:.2f})")
         """
-        results = []
+        run_config = self._run_config(extraction_schema, use_llm, llm_provider, llm_instruction)
+        sem = asyncio.Semaphore(max_concurrent)
 
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            for url in urls:
+        async def hunt_one(crawler: Any, url: str) -> HuntResult:
+            async with sem:
                 try:
                     result = await self._hunt_single(
                         crawler,
                         url,
                         extraction_schema,
-                        use_llm,
-                        llm_provider,
-                        llm_instruction
-                    )
-                    results.append(result)
-
-                    self.hunts_completed += 1
-                    self.total_leads_found += result.leads_found
-
-                    logger.info(
-                        f"✓ Hunt {self.hunts_completed}: {url} → "
-                        f"{result.leads_found} leads (C={result.coherence_score:.2f})"
+                        run_config
                     )
-
                 except Exception as e:
                     logger.error(f"❌ Hunt failed for {url}: {e}")
-                    results.append(HuntResult(
+                    return HuntResult(
                         url=url,
                         leads_found=0,
                         raw_markdown="",
@@ -173,47 +213,72 @@ class EnhancedWebHunter:
                         hunt_time_seconds=0.0,
                         success=False,
                         error=str(e)
-                    ))
+                    )
 
-        return results
+            self.hunts_completed += 1
+            self.total_leads_found += result.leads_found
 
-    async def _hunt_single(
+            logger.info(
+                f"✓ Hunt {self.hunts_completed}: {url} → "
+                f"{result.leads_found} leads (C={result.coherence_score:.2f})"
+            )
+            return result
+
+        if self._crawler is not None:
+            results = await asyncio.gather(*[hunt_one(self._crawler, url) for url in urls])
+        else:
+            async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                results = await asyncio.gather(*[hunt_one(crawler, url) for url in urls])
+
+        return list(results)
+
+    def _run_config(
         self,
-        crawler: Any,  # AsyncWebCrawler
-        url: str,
         schema: Dict[str, Any],
         use_llm: bool,
         llm_provider: str,
         llm_instruction: Optional[str]
-    ) -> HuntResult:
-        """Hunt a single URL with Rose Glass perception"""
-        start_time = time.time()
-
-        # Configure extraction strategy
-        if use_llm:
-            strategy = LLMExtractionStrategy(
-                provider=llm_provider,
-                schema=schema,
-                instruction=llm_instruction or "Extract structured data from this page."
+    ) -> Any:  # CrawlerRunConfig
+        """Crawl config for a schema and extraction mode, built on first use"""
+        key = (json.dumps(schema, sort_keys=True), use_llm, llm_provider, llm_instruction)
+        run_config = self._run_configs.get(key)
+        if run_config is None:
+            # Configure extraction strategy
+            if use_llm:
+                strategy = LLMExtractionStrategy(
+                    provider=llm_provider,
+                    schema=schema,
+                    instruction=llm_instruction or "Extract structured data from this page."
+                )
+            else:
+                strategy = JsonCssExtractionStrategy(schema=schema)
+
+            run_config = CrawlerRunConfig(
+                extraction_strategy=strategy,
+                cache_mode="bypass",  # Always fresh data
+                wait_for="networkidle"  # Wait for dynamic content
             )
-        else:
-            strategy = JsonCssExtractionStrategy(schema=schema)
+            self._run_configs[key] = run_config
+        return run_config
 
-        run_config = CrawlerRunConfig(
-            extraction_strategy=strategy,
-            cache_mode="bypass",  # Always fresh data
-            wait_for="networkidle"  # Wait for dynamic content
-        )
+    async def _hunt_single(
+        self,
+        crawler: Any,  # AsyncWebCrawler
+        url: str,
+        schema: Dict[str, Any],
+        run_config: Any  # CrawlerRunConfig
+    ) -> HuntResult:
+        """Hunt a single URL with Rose Glass perception"""
+        start_ns = time.perf_counter_ns()
 
         # Execute crawl
         result = await crawler.arun(url=url, config=run_config)
 
-        hunt_time = time.time() - start_time
+        hunt_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Parse extracted data
         extracted = result.extracted_content or []
         if isinstance(extracted, str):
-            import json
             try:
                 extracted = json.loads(extracted)
             except:
@@ -251,37 +316,55 @@ class EnhancedWebHunter:
 
         Returns: (Ψ, ρ, q, f) tuple
         """
-        # Ψ (psi) - Content richness
-        markdown = crawl_result.markdown or ""
-        psi = min(len(markdown) / 10000, 1.0)  # Normalize to 10k chars
-
-        # ρ (rho) - Authority (success + HTML structure quality)
-        rho = 0.0
-        if crawl_result.success:
-            rho += 0.5
-        if crawl_result.html and len(crawl_result.html) > 1000:
-            rho += 0.3  # Substantial page
-        if markdown and markdown.count('\n') > 20:
-            rho += 0.2  # Good structure
-        rho = min(rho, 1.0)
-
-        # q - Freshness (assume recent for now - could check headers)
-        q = 0.8  # Default assumption
-
-        # f - Fit (extraction match quality)
-        expected_fields = len(schema.get('fields', []))
-        if expected_fields > 0 and leads_found > 0:
-            # Check if extracted data has the expected fields
-            avg_fields = sum(
-                len([k for k in lead.keys() if k in [f['name'] for f in schema.get('fields', [])]])
-                for lead in (crawl_result.extracted_content if isinstance(crawl_result.extracted_content, list) else [])
-            ) / leads_found if leads_found > 0 else 0
-
-            f = min(avg_fields / expected_fields, 1.0) if expected_fields > 0 else 0.5
-        else:
-            f = 0.3  # Low match if no leads found
+        return page_dimensions(crawl_result, leads_found, schema)
+
+
+def page_dimensions(
+    crawl_result: Any,
+    leads_found: int,
+    schema: Dict[str, Any]
+) -> tuple[float, float, float, float]:
+    """
+    Calculate Rose Glass dimensions for a fetched page.
+
+    ``crawl_result`` needs ``markdown``, ``html``, ``success`` and
+    ``extracted_content`` attributes (a crawl4ai CrawlResult or any page
+    object shaped like one).
+
+    Returns: (Ψ, ρ, q, f) tuple
+    """
+    # Ψ (psi) - Content richness
+    markdown = crawl_result.markdown or ""
+    psi = min(len(markdown) / 10000, 1.0)  # Normalize to 10k chars
+
+    # ρ (rho) - Authority (success + HTML structure quality)
+    rho = 0.0
+    if crawl_result.success:
+        rho += 0.5
+    if crawl_result.html and len(crawl_result.html) > 1000:
+        rho += 0.3  # Substantial page
+    if markdown and markdown.count('\n') > 20:
+        rho += 0.2  # Good structure
+    rho = min(rho, 1.0)
+
+    # q - Freshness (assume recent for now - could check headers)
+    q = 0.8  # Default assumption
+
+    # f - Fit (extraction match quality)
+    expected_fields = len(schema.get('fields', []))
+    if expected_fields > 0 and leads_found > 0:
+        # Check if extracted data has the expected fields
+        extracted = crawl_result.extracted_content
+        avg_fields = sum(
+            len([k for k in lead.keys() if k in [f['name'] for f in schema.get('fields', [])]])
+            for lead in (extracted if isinstance(extracted, list) else [])
+        ) / leads_found if leads_found > 0 else 0
+
+        f = min(avg_fields / expected_fields, 1.0) if expected_fields > 0 else 0.5
+    else:
+        f = 0.3  # Low match if no leads found
 
-        return (psi, rho, q, f)
+    return (psi, rho, q, f)
 
 
 # Pre-configured extraction schemas
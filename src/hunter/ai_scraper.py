@@ -196,7 +196,7 @@ class AIScraper:
                 url = f"{base_url}{separator}{page_param}={page_num}"
 
                 try:
-                    logger.info(f"🔍 Scraping page {page_num}: {url}")
+                    logger.info("🔍 Scraping page %s: %s", page_num, url)
 
                     result = await crawler.arun(url=url, config=run_config)
 
@@ -211,7 +211,7 @@ class AIScraper:
                                         lead = BusinessLead(**item, source_url=url)
                                         all_leads.append(lead)
                                     except Exception as e:
-                                        logger.warning(f"Invalid lead data: {e}")
+                                        logger.warning("Invalid lead data: %s", e)
                                 else:
                                     # Fallback without Pydantic validation
                                     item['source_url'] = url
@@ -220,16 +220,19 @@ class AIScraper:
                             self.pages_processed += 1
                             self.leads_scraped += len(data)
 
-                            logger.info(f"  ✓ Found {len(data)} leads on page {page_num}")
+                            logger.info("  ✓ Found %d leads on page %s", len(data), page_num)
                         else:
-                            logger.info(f"  ⚠️  No leads found on page {page_num} - stopping")
+                            logger.info("  ⚠️  No leads found on page %s - stopping", page_num)
                             break  # No more results, stop pagination
 
                 except Exception as e:
-                    logger.error(f"  ❌ Page {page_num} failed: {e}")
+                    logger.error("  ❌ Page %s failed: %s", page_num, e)
                     break  # Stop on error
 
-        logger.info(f"✓ Scraping complete: {len(all_leads)} total leads from {self.pages_processed} pages")
+        logger.info(
+            "✓ Scraping complete: %d total leads from %s pages",
+            len(all_leads), self.pages_processed
+        )
         return all_leads
 
     def _parse_llm_response(self, content: str) -> List[Dict[str, Any]]:
@@ -242,7 +245,7 @@ class AIScraper:
             if isinstance(data, dict):
                 data = [data]
             elif not isinstance(data, list):
-                logger.warning(f"Unexpected LLM response type: {type(data)}")
+                logger.warning("Unexpected LLM response type: %s", type(data))
                 return []
 
             return data
@@ -293,7 +296,7 @@ class AIScraper:
                 else:
                     writer.writerow(vars(lead))
 
-        logger.info(f"✓ Exported {len(leads)} leads to {filepath}")
+        logger.info("✓ Exported %d leads to %s", len(leads), filepath)
 
     def export_to_json(
         self,
@@ -321,7 +324,7 @@ class AIScraper:
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
 
-        logger.info(f"✓ Exported {len(leads)} leads to {filepath}")
+        logger.info("✓ Exported %d leads to %s", len(leads), filepath)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get scraping statistics"""
@@ -6,7 +6,7 @@ Ingests leads from structured data sources (CSV, JSON, CRM exports, manual entry
 Normalizes various formats into LeadData for Rose Glass perception.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime
 from pathlib import Path
@@ -21,10 +21,19 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 # Import LeadData from core
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from core.rose_glass_lens import LeadData
+try:
+    from ..core.rose_glass_lens import LeadData
+except ImportError:  # Loaded as top-level 'hunter' package (src/ on sys.path)
+    from core.rose_glass_lens import LeadData
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -67,6 +76,13 @@ class FieldMapping:
     notes: Optional[str] = None
 
 
+# Mapping for sources that already use the canonical FieldMapping column names
+_IDENTITY_MAPPING = FieldMapping(**{
+    name: name for name in vars(FieldMapping()) if name != 'source'
+})
+_IDENTITY_COLUMNS = frozenset(vars(_IDENTITY_MAPPING)) - {'source'}
+
+
 class DataHunter:
     """
     Ingests leads from structured data sources.
@@ -103,23 +119,23 @@ class DataHunter:
             logger.error("pandas required for CSV ingestion - install with: pip install pandas")
             return []
 
-        logger.info(f"📥 Ingesting CSV: {filepath}")
+        logger.info("📥 Ingesting CSV: %s", filepath)
 
         try:
             df = pd.read_csv(filepath, encoding=encoding)
-            logger.info(f"  Found {len(df)} rows")
+            logger.info("  Found %d rows", len(df))
 
             # Auto-detect field mapping if not provided
             if field_mapping is None:
                 field_mapping = self._auto_detect_fields(df.columns.tolist())
 
             leads = self._dataframe_to_leads(df, field_mapping, source=f'csv:{filepath.name}')
-            logger.info(f"✓ Ingested {len(leads)} leads from CSV")
+            logger.info("✓ Ingested %d leads from CSV", len(leads))
 
             return leads
 
         except Exception as e:
-            logger.error(f"CSV ingestion failed: {e}")
+            logger.error("CSV ingestion failed: %s", e)
             return []
 
     def ingest_json(
@@ -132,11 +148,11 @@ class DataHunter:
 
         Supports both single object and array of objects.
         """
-        logger.info(f"📥 Ingesting JSON: {filepath}")
+        logger.info("📥 Ingesting JSON: %s", filepath)
 
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _json_loads(f.read())
 
             # Handle single object vs array
             if isinstance(data, dict):
@@ -145,23 +161,30 @@ class DataHunter:
                 logger.error("JSON must be object or array of objects")
                 return []
 
-            logger.info(f"  Found {len(data)} records")
+            logger.info("  Found %d records", len(data))
 
             # Auto-detect field mapping if not provided
             if field_mapping is None and data:
                 field_mapping = self._auto_detect_fields(data[0].keys())
 
-            leads = []
-            for record in data:
-                lead = self._dict_to_lead(record, field_mapping, source=f'json:{filepath.name}')
+            source = f'json:{filepath.name}'
+            batch_salt = datetime.now().isoformat().encode()
+
+            # Record count is known up front - allocate once, trim skipped rows
+            leads = [None] * len(data)
+            out = 0
+            for row_index, record in enumerate(data):
+                lead = self._dict_to_lead(record, field_mapping, source, batch_salt, row_index)
                 if lead:
-                    leads.append(lead)
+                    leads[out] = lead
+                    out += 1
+            del leads[out:]
 
-            logger.info(f"✓ Ingested {len(leads)} leads from JSON")
+            logger.info("✓ Ingested %d leads from JSON", len(leads))
             return leads
 
         except Exception as e:
-            logger.error(f"JSON ingestion failed: {e}")
+            logger.error("JSON ingestion failed: %s", e)
             return []
 
     def ingest_dict(
@@ -185,13 +208,18 @@ class DataHunter:
         if field_mapping is None and data:
             field_mapping = self._auto_detect_fields(data[0].keys())
 
-        leads = []
-        for record in data:
-            lead = self._dict_to_lead(record, field_mapping, source=source)
+        batch_salt = datetime.now().isoformat().encode()
+
+        leads = [None] * len(data)
+        out = 0
+        for row_index, record in enumerate(data):
+            lead = self._dict_to_lead(record, field_mapping, source, batch_salt, row_index)
             if lead:
-                leads.append(lead)
+                leads[out] = lead
+                out += 1
+        del leads[out:]
 
-        logger.info(f"✓ Ingested {len(leads)} leads from dict")
+        logger.info("✓ Ingested %d leads from dict", len(leads))
         return leads
 
     def ingest_dataframe(
@@ -250,7 +278,12 @@ class DataHunter:
         Auto-detect field mappings from column names.
 
         Handles common CRM export formats (Salesforce, HubSpot, Pipedrive).
+        Sources with every canonical column name present verbatim skip
+        detection and get a copy of _IDENTITY_MAPPING.
         """
+        if _IDENTITY_COLUMNS.issubset(columns):
+            return replace(_IDENTITY_MAPPING)
+
         mapping = FieldMapping()
 
         # Normalize column names
@@ -312,7 +345,10 @@ class DataHunter:
                 mapping.notes = col_map[variant]
                 break
 
-        logger.info(f"  Auto-detected mappings: company={mapping.company_name}, email={mapping.contact_email}")
+        logger.info(
+            "  Auto-detected mappings: company=%s, email=%s",
+            mapping.company_name, mapping.contact_email
+        )
         return mapping
 
     def _dataframe_to_leads(
@@ -322,41 +358,69 @@ class DataHunter:
         source: str
     ) -> List[LeadData]:
         """Convert DataFrame to list of LeadData"""
-        leads = []
+        batch_salt = datetime.now().isoformat().encode()
+        leads = [None] * len(df)
+        out = 0
+
+        # Only the mapped columns are read; plain tuples avoid building a
+        # Series per row (iterrows)
+        cols = self._mapped_columns(field_mapping, df.columns)
+        rows = df[cols].itertuples(index=False, name=None)
 
-        for idx, row in df.iterrows():
+        for row_index, (idx, row) in enumerate(zip(df.index, rows)):
+            data = dict(zip(cols, row))
             try:
-                lead = self._dict_to_lead(row.to_dict(), field_mapping, source)
+                lead = self._dict_to_lead(data, field_mapping, source, batch_salt, row_index)
                 if lead:
-                    leads.append(lead)
+                    leads[out] = lead
+                    out += 1
             except Exception as e:
-                logger.warning(f"  Row {idx} failed: {e}")
+                logger.warning("  Row %s failed: %s", idx, e)
                 self.validation_errors.append({
                     'row': idx,
                     'error': str(e),
-                    'data': row.to_dict()
+                    'data': data
                 })
 
+        del leads[out:]
         return leads
 
+    def _mapped_columns(self, field_mapping: FieldMapping, columns: Any) -> List[str]:
+        """Columns that _dict_to_lead can read under this mapping (in frame order)"""
+        wanted = {name for name in vars(field_mapping).values() if name}
+        if not field_mapping.contact_email:
+            wanted.add('email')  # Fallback key used for lead ID generation
+        return [col for col in columns if col in wanted]
+
     def _dict_to_lead(
         self,
         data: Dict[str, Any],
         field_mapping: FieldMapping,
-        source: str
+        source: str,
+        batch_salt: bytes = b'',
+        row_index: int = 0
     ) -> Optional[LeadData]:
-        """Convert dictionary to LeadData using field mapping"""
+        """
+        Convert dictionary to LeadData using field mapping.
+
+        batch_salt and row_index are mixed into the lead ID hash; callers
+        compute the salt once per ingest (the ingest timestamp) and pass each
+        row's position, so identical rows in one batch still get distinct IDs.
+        """
 
         # Required field
         company_name = data.get(field_mapping.company_name)
-        if not company_name or pd.isna(company_name):
-            logger.warning(f"  Skipping record - missing company name")
+        if not company_name or (PANDAS_AVAILABLE and pd.isna(company_name)):
+            logger.warning("  Skipping record - missing company name")
             return None
 
         # Generate lead ID
-        lead_id = hashlib.md5(
-            f"{company_name}_{data.get(field_mapping.contact_email or 'email', '')}_{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:12]
+        id_hash = hashlib.md5(
+            f"{company_name}_{data.get(field_mapping.contact_email or 'email', '')}_".encode()
+        )
+        id_hash.update(batch_salt)
+        id_hash.update(b'#%d' % row_index)
+        lead_id = id_hash.hexdigest()[:12]
 
         # Extract optional fields
         def get_field(mapping_field: Optional[str], default=None):
@@ -436,24 +500,24 @@ class DataHunter:
             return []
 
         if isinstance(value, list):
-            return [str(x) for x in value]
+            return list(map(str, value))
 
-        if isinstance(value, str):
-            # Try JSON
-            if value.startswith('['):
-                try:
-                    return json.loads(value)
-                except:
-                    pass
+        if not isinstance(value, str):
+            return []
 
-            # Try comma-separated
-            if ',' in value:
-                return [x.strip() for x in value.split(',')]
+        s = value.strip()
+        if not s:
+            return []
 
-            # Single value
-            return [value] if value else []
+        # JSON array
+        if s[0] == '[':
+            try:
+                return [str(x) for x in _json_loads(s)]
+            except ValueError:
+                pass
 
-        return []
+        # Comma-separated (split() also covers the single-value case)
+        return [x.strip() for x in s.split(',')]
 
     def _parse_bool(self, value: Any) -> Optional[bool]:
         """Parse boolean from various formats"""
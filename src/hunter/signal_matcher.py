@@ -0,0 +1,93 @@
+"""
+Signal Matcher
+==============
+
+Keyword matching for hunt signal detection.
+
+Keyword lists are lower-cased once up front. Small lists use plain substring
+checks; large lists (roughly 50+ keywords scanned across hundreds of results)
+switch to a Numba-compiled byte matcher when numba is installed.
+"""
+
+from typing import List
+import sys
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many keywords the JIT call overhead outweighs the scan itself
+NUMBA_MIN_KEYWORDS = 50
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def keyword_hits(text_codes, kw_starts, kw_lens, kw_pool):
+        """
+        Bytewise substring search of every keyword in one text.
+
+        Keywords are packed back to back in kw_pool; keyword k occupies
+        kw_pool[kw_starts[k]:kw_starts[k] + kw_lens[k]].
+
+        Returns a uint8 array with 1 where the keyword occurs in the text.
+        """
+        n_text = text_codes.shape[0]
+        n_kw = kw_starts.shape[0]
+        hits = np.zeros(n_kw, dtype=np.uint8)
+
+        for k in range(n_kw):
+            start = kw_starts[k]
+            length = kw_lens[k]
+            for i in range(n_text - length + 1):
+                j = 0
+                while j < length and text_codes[i + j] == kw_pool[start + j]:
+                    j += 1
+                if j == length:
+                    hits[k] = 1
+                    break
+
+        return hits
+
+
+class KeywordSet:
+    """
+    A keyword list prepared for repeated matching against lower-cased text.
+
+    Matches are reported using the keywords' original spelling.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(keywords)
+        self.lowered = [sys.intern(k.lower()) for k in self.keywords]
+
+        self.use_numba = NUMBA_AVAILABLE and len(self.keywords) >= NUMBA_MIN_KEYWORDS
+        if self.use_numba:
+            # UTF-8 is self-synchronizing, so byte substring matches are
+            # exactly str substring matches
+            encoded = [k.encode() for k in self.lowered]
+            self._kw_lens = np.array([len(b) for b in encoded], dtype=np.int64)
+            self._kw_starts = np.zeros(len(encoded), dtype=np.int64)
+            np.cumsum(self._kw_lens[:-1], out=self._kw_starts[1:])
+            self._kw_pool = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _hits(self, text: str):
+        text_codes = np.frombuffer(text.encode(), dtype=np.uint8)
+        return keyword_hits(text_codes, self._kw_starts, self._kw_lens, self._kw_pool)
+
+    def matches(self, text: str) -> List[str]:
+        """Keywords occurring in ``text`` (which must already be lower-cased)"""
+        if self.use_numba:
+            return [kw for kw, hit in zip(self.keywords, self._hits(text)) if hit]
+        return [kw for kw, kw_lc in zip(self.keywords, self.lowered) if kw_lc in text]
+
+    def any_in(self, text: str) -> bool:
+        """True if any keyword occurs in ``text`` (which must already be lower-cased)"""
+        if self.use_numba:
+            return bool(self._hits(text).any())
+        return any(kw_lc in text for kw_lc in self.lowered)
@@ -9,10 +9,9 @@ Creates initial LeadData objects with basic signals for Rose Glass perception.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
-import re
 import hashlib
 import logging
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit
 import asyncio
 
 try:
@@ -28,14 +27,21 @@ except ImportError:
     BS4_AVAILABLE = False
 
 # Import LeadData from core
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from core.rose_glass_lens import LeadData
+try:
+    from ..core.rose_glass_lens import LeadData
+except ImportError:  # Loaded as top-level 'hunter' package (src/ on sys.path)
+    from core.rose_glass_lens import LeadData
+
+from .signal_matcher import KeywordSet
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Domain labels use dashes/underscores where company names use spaces
+_DASH_TO_SPACE = str.maketrans('-_', '  ')
+
+_URGENCY_KEYWORDS = ('urgent', 'immediate', 'asap', 'struggling', 'need', 'help')
+
 
 @dataclass
 class HuntCriteria:
@@ -62,6 +68,42 @@ class HuntCriteria:
     min_company_size_employees: Optional[int] = None
     max_company_size_employees: Optional[int] = None
 
+    def __post_init__(self):
+        # field name -> (keywords the set was built from, KeywordSet)
+        self._keyword_sets: Dict[str, tuple] = {}
+
+    def _keyword_set(self, name: str) -> KeywordSet:
+        """
+        KeywordSet for a list field, rebuilt only when the list has changed
+        since the last call (so in-place edits are never matched stale).
+        """
+        current = tuple(getattr(self, name))
+        cached = self._keyword_sets.get(name)
+        if cached is None or cached[0] != current:
+            cached = (current, KeywordSet(current))
+            self._keyword_sets[name] = cached
+        return cached[1]
+
+    @property
+    def industry_set(self) -> KeywordSet:
+        """Prepared target_industries"""
+        return self._keyword_set('target_industries')
+
+    @property
+    def pain_set(self) -> KeywordSet:
+        """Prepared pain_keywords"""
+        return self._keyword_set('pain_keywords')
+
+    @property
+    def excluded_competitor_set(self) -> KeywordSet:
+        """Prepared exclude_competitors"""
+        return self._keyword_set('exclude_competitors')
+
+    @property
+    def excluded_industry_set(self) -> KeywordSet:
+        """Prepared exclude_industries"""
+        return self._keyword_set('exclude_industries')
+
     def generate_search_queries(self) -> List[str]:
         """Generate search queries based on criteria"""
         queries = []
@@ -143,11 +185,37 @@ class WebHunter:
         self.rate_limit_seconds = rate_limit_seconds
         self.last_request_time = 0
 
+        # Shared HTTP session, opened by ``async with WebHunter(...)``
+        self._session = None
+
         if not AIOHTTP_AVAILABLE:
             logger.warning("aiohttp not available - install for async web hunting")
         if not BS4_AVAILABLE:
             logger.warning("beautifulsoup4 not available - install for HTML parsing")
 
+    async def __aenter__(self) -> 'WebHunter':
+        """
+        Open one HTTP session for the lifetime of the hunter.
+
+        All queries share its connection pool and DNS cache, so repeated
+        calls to the same search API reuse TLS connections.
+        """
+        if AIOHTTP_AVAILABLE and self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=300),
+                headers={'User-Agent': self.user_agent},
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the shared HTTP session (if open)"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def hunt(self, criteria: HuntCriteria) -> List[HuntResult]:
         """
         Execute a hunt based on criteria.
@@ -155,13 +223,13 @@ class WebHunter:
         Returns list of HuntResult objects ready for Rose Glass perception.
         """
         hunt_id = hashlib.md5(f"{datetime.now().isoformat()}".encode()).hexdigest()[:8]
-        logger.info(f"🔍 Starting hunt {hunt_id} for industries: {criteria.target_industries}")
+        logger.info("🔍 Starting hunt %s for industries: %s", hunt_id, criteria.target_industries)
 
         results = []
         queries = criteria.generate_search_queries()
 
         for query in queries:
-            logger.info(f"  Searching: {query}")
+            logger.info("  Searching: %s", query)
             query_results = await self._search_web(query, criteria)
             results.extend(query_results)
 
@@ -176,7 +244,7 @@ class WebHunter:
                 seen_companies.add(result.company_name)
                 unique_results.append(result)
 
-        logger.info(f"✓ Hunt {hunt_id} complete: {len(unique_results)} unique leads discovered")
+        logger.info("✓ Hunt %s complete: %d unique leads discovered", hunt_id, len(unique_results))
         return unique_results[:criteria.max_results_per_hunt]
 
     async def _search_web(self, query: str, criteria: HuntCriteria) -> List[HuntResult]:
@@ -188,12 +256,16 @@ class WebHunter:
         - Bing Search API
         - LinkedIn Sales Navigator API
         - ZoomInfo or similar data provider
+
+        API requests should go through ``self._session`` (opened by
+        ``async with``) rather than ad-hoc sessions, so connections are
+        reused across queries.
         """
         results = []
 
         # Simulated search results (replace with real API in production)
         # This demonstrates the structure - actual implementation would call search APIs
-        logger.info(f"    [DEMO MODE] Would search: {query}")
+        logger.info("    [DEMO MODE] Would search: %s", query)
         logger.info("    Production: Integrate Google Custom Search API or similar")
 
         # Demo result structure:
@@ -229,24 +301,22 @@ class WebHunter:
         # Extract company name from URL or title
         company_name = self._extract_company_name(url, title)
 
-        # Detect signals
         text = f"{title} {snippet}".lower()
 
-        industry_signals = [ind for ind in criteria.target_industries if ind.lower() in text]
-        pain_signals = [pain for pain in criteria.pain_keywords if pain.lower() in text]
-
-        urgency_keywords = ['urgent', 'immediate', 'asap', 'struggling', 'need', 'help']
-        urgency_signals = [word for word in urgency_keywords if word in text]
-
-        # Check exclusions
-        if any(comp.lower() in text for comp in criteria.exclude_competitors):
-            logger.info(f"    Skipping competitor: {company_name}")
+        # Check exclusions first - no point detecting signals on a skipped result
+        if criteria.excluded_competitor_set.any_in(text):
+            logger.info("    Skipping competitor: %s", company_name)
             return None
 
-        if any(ind.lower() in text for ind in criteria.exclude_industries):
-            logger.info(f"    Skipping excluded industry: {company_name}")
+        if criteria.excluded_industry_set.any_in(text):
+            logger.info("    Skipping excluded industry: %s", company_name)
             return None
 
+        # Detect signals (keyword sets are cached on HuntCriteria)
+        industry_signals = criteria.industry_set.matches(text)
+        pain_signals = criteria.pain_set.matches(text)
+        urgency_signals = [word for word in _URGENCY_KEYWORDS if word in text]
+
         return HuntResult(
             url=url,
             title=title,
@@ -260,12 +330,15 @@ class WebHunter:
     def _extract_company_name(self, url: str, title: str) -> str:
         """Extract company name from URL or title"""
         # Try to extract from domain
-        domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
-        if domain_match:
-            domain = domain_match.group(1)
-            # Clean up domain
-            name = domain.split('.')[0]
-            return name.replace('-', ' ').title()
+        try:
+            host = urlsplit(url).hostname or ''
+        except ValueError:  # Malformed netloc (e.g. bad IPv6 literal)
+            host = ''
+
+        if host.startswith('www.'):
+            host = host[4:]
+        if host:
+            return host.split('.', 1)[0].translate(_DASH_TO_SPACE).title()
 
         # Fallback to first part of title
         return title.split('|')[0].split('-')[0].strip()
@@ -281,7 +354,7 @@ class WebHunter:
         - Check company size (LinkedIn, Crunchbase)
         - Identify decision makers
         """
-        logger.info(f"🔬 Enriching lead: {lead.company_name}")
+        logger.info("🔬 Enriching lead: %s", lead.company_name)
 
         # Demo: Simulated enrichment
         # Production would use:
@@ -304,7 +377,11 @@ class WebHunter:
             logger.error("aiohttp required for web hunting - install with: pip install aiohttp")
             return []
 
-        return asyncio.run(self.hunt(criteria))
+        async def _run() -> List[HuntResult]:
+            async with self:
+                return await self.hunt(criteria)
+
+        return asyncio.run(_run())
 
 
 # Example usage
@@ -324,7 +401,8 @@ if __name__ == "__main__":
 
     # Async hunt
     async def demo():
-        results = await hunter.hunt(criteria)
+        async with hunter:
+            results = await hunter.hunt(criteria)
 
         print(f"\n🎯 Hunt Results: {len(results)} leads")
         for result in results[:3]:
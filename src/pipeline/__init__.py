@@ -1,5 +1,8 @@
 """Pipeline stages for lead progression"""
-from .qualifier import LeadQualifier, QualificationResult
+from .qualifier import LeadQualifier, QualificationResult, get_qualifier
 from .outcome import OutcomeRecorder, Outcome, OutcomeType
 
-__all__ = ['LeadQualifier', 'QualificationResult', 'OutcomeRecorder', 'Outcome', 'OutcomeType']
+__all__ = [
+    'LeadQualifier', 'QualificationResult', 'get_qualifier',
+    'OutcomeRecorder', 'Outcome', 'OutcomeType',
+]
@@ -4,20 +4,50 @@ Outcome Recorder
 
 Records final outcomes of leads and extracts learnings.
 Feeds nutrients to graveyard for system evolution.
+
+Outcomes are appended to JSONL logs (one record per line) through buffered
+handles, sharded by trial branch: outcomes_<branch>.jsonl, with unbranched
+outcomes in outcomes.jsonl. Legacy one-file-per-outcome JSON is still read.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from collections import defaultdict
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
+import atexit
 import logging
 import json
-import hashlib
+import mmap
+import re
+import sys
+import weakref
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OUTCOME_LOG_NAME = 'outcomes.jsonl'
+OUTCOME_LOG_GLOB = 'outcomes*.jsonl'
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]')
+
+_DATETIME_KEYS = ('created_at', 'first_contact_at', 'qualified_at', 'outcome_at')
+
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    _json_bytes = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 
 class OutcomeType(Enum):
     """Final outcome categories"""
@@ -31,7 +61,19 @@ class OutcomeType(Enum):
     NURTURE_ONGOING = 'nurture_ongoing'    # Still in nurture
 
 
-@dataclass
+_LOST_OUTCOMES = frozenset({
+    OutcomeType.LOST_TO_COMPETITOR,
+    OutcomeType.LOST_NO_BUDGET,
+    OutcomeType.LOST_NO_DECISION,
+    OutcomeType.LOST_TIMING,
+    OutcomeType.LOST_DARK,
+})
+# Outcomes whose learnings feed the graveyard
+_NUTRIENT_OUTCOMES = _LOST_OUTCOMES | {OutcomeType.DISQUALIFIED}
+_METRIC_TIERS = ('hot', 'warm', 'cold', 'disqualified')
+
+
+@dataclass(slots=True)
 class Outcome:
     """Record of a lead's final outcome"""
 
@@ -46,10 +88,10 @@ class Outcome:
     cost_to_acquire: float = 0.0     # Sales/marketing costs
 
     # Timeline
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None    # Defaults to now (see __post_init__)
     first_contact_at: Optional[datetime] = None
     qualified_at: Optional[datetime] = None
-    outcome_at: datetime = field(default_factory=datetime.now)
+    outcome_at: Optional[datetime] = None    # Defaults to now (see __post_init__)
 
     # Journey metadata
     qualification_tier: Optional[str] = None  # 'hot', 'warm', 'cold'
@@ -66,30 +108,49 @@ class Outcome:
     # Notes
     notes: str = ''
 
+    # Derived in __post_init__ (outcome type and timeline are set once)
+    _is_won: bool = field(init=False, repr=False, compare=False)
+    _is_lost: bool = field(init=False, repr=False, compare=False)
+    _days_to_close: Optional[int] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Calculate derived metrics"""
         if isinstance(self.outcome_type, str):
             self.outcome_type = OutcomeType(self.outcome_type)
+        # One clock read covers both timestamps
+        if self.created_at is None or self.outcome_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.outcome_at is None:
+                self.outcome_at = now
+        # Tiers decoded from storage share the interned literals, so tier
+        # lookups hit the identity fast path
+        if self.qualification_tier is not None:
+            self.qualification_tier = sys.intern(self.qualification_tier)
+
+        self._is_won = self.outcome_type is OutcomeType.WON
+        self._is_lost = self.outcome_type in _LOST_OUTCOMES
+        self._days_to_close = (
+            (self.outcome_at - self.first_contact_at).days if self.first_contact_at else None
+        )
 
     @property
     def is_won(self) -> bool:
-        return self.outcome_type == OutcomeType.WON
+        return self._is_won
 
     @property
     def is_lost(self) -> bool:
-        return self.outcome_type.value.startswith('lost_')
+        return self._is_lost
 
     @property
     def is_disqualified(self) -> bool:
-        return self.outcome_type == OutcomeType.DISQUALIFIED
+        return self.outcome_type is OutcomeType.DISQUALIFIED
 
     @property
     def days_to_close(self) -> Optional[int]:
         """Days from first contact to outcome"""
-        if self.first_contact_at:
-            delta = self.outcome_at - self.first_contact_at
-            return delta.days
-        return None
+        return self._days_to_close
 
     @property
     def roi(self) -> float:
@@ -99,20 +160,25 @@ class Outcome:
         return 0.0
 
     def to_dict(self) -> Dict[str, Any]:
+        # Derived flags come from the fields precomputed in __post_init__
+        coherence_score = self.coherence_score
+        cost = self.cost_to_acquire
+        deal_value = self.deal_value
+
         return {
             'lead_id': self.lead_id,
             'company_name': self.company_name,
             'outcome_type': self.outcome_type.value,
-            'is_won': self.is_won,
-            'is_lost': self.is_lost,
-            'deal_value': round(self.deal_value, 2),
+            'is_won': self._is_won,
+            'is_lost': self._is_lost,
+            'deal_value': round(deal_value, 2),
             'expected_value': round(self.expected_value, 2),
-            'cost_to_acquire': round(self.cost_to_acquire, 2),
-            'roi': round(self.roi, 2),
-            'days_to_close': self.days_to_close,
+            'cost_to_acquire': round(cost, 2),
+            'roi': round((deal_value - cost) / cost, 2) if cost > 0 else 0.0,
+            'days_to_close': self._days_to_close,
             'outcome_at': self.outcome_at.isoformat(),
             'qualification_tier': self.qualification_tier,
-            'coherence_score': round(self.coherence_score, 3) if self.coherence_score else None,
+            'coherence_score': round(coherence_score, 3) if coherence_score else None,
             'trial_branch': self.trial_branch,
             'loss_reason': self.loss_reason,
             'competitor_chosen': self.competitor_chosen,
@@ -124,6 +190,115 @@ class Outcome:
             'notes': self.notes,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Outcome':
+        """Rebuild an Outcome from a to_dict() record"""
+        # Only constructor fields are kept; derived to_dict() keys and any
+        # keys from other versions are dropped
+        kwargs = {k: v for k, v in data.items() if k in _OUTCOME_INIT_FIELDS}
+        learnings = data.get('learnings')
+        if learnings:
+            kwargs.update((k, v) for k, v in learnings.items() if k in _OUTCOME_INIT_FIELDS)
+        for key in _DATETIME_KEYS:
+            if isinstance(kwargs.get(key), str):
+                kwargs[key] = datetime.fromisoformat(kwargs[key])
+        return cls(**kwargs)
+
+
+_OUTCOME_INIT_FIELDS = frozenset(f.name for f in fields(Outcome) if f.init)
+
+
+@dataclass(slots=True)
+class _ConversionTally:
+    """Running conversion counters, updated as outcomes are recorded"""
+
+    total: int = 0
+    won: int = 0
+    lost: int = 0
+    disqualified: int = 0
+    total_revenue: float = 0
+    total_cost: float = 0
+    # tier -> [total, won]
+    tier_counts: Dict[str, List[int]] = field(
+        default_factory=lambda: {tier: [0, 0] for tier in _METRIC_TIERS}
+    )
+    days_count: int = 0
+    days_sum: int = 0
+    fastest_deal: Optional[int] = None
+    slowest_deal: Optional[int] = None
+
+    def add(self, o: Outcome):
+        is_won = o._is_won
+        self.total += 1
+
+        if is_won:
+            self.won += 1
+            self.total_revenue += o.deal_value
+            days = o._days_to_close
+            if days:
+                self.days_count += 1
+                self.days_sum += days
+                if self.fastest_deal is None or days < self.fastest_deal:
+                    self.fastest_deal = days
+                if self.slowest_deal is None or days > self.slowest_deal:
+                    self.slowest_deal = days
+        elif o._is_lost:
+            self.lost += 1
+        elif o.outcome_type is OutcomeType.DISQUALIFIED:
+            self.disqualified += 1
+
+        if o.cost_to_acquire > 0:
+            self.total_cost += o.cost_to_acquire
+
+        tier_count = self.tier_counts.get(o.qualification_tier)
+        if tier_count is not None:
+            tier_count[0] += 1
+            tier_count[1] += is_won
+
+    def metrics(self) -> Dict[str, Any]:
+        total, won = self.total, self.won
+        total_revenue, total_cost = self.total_revenue, self.total_cost
+        avg_deal_size = total_revenue / won if won else 0
+        avg_days_to_close = self.days_sum / self.days_count if self.days_count else 0
+
+        return {
+            'total_outcomes': total,
+            'won': won,
+            'lost': self.lost,
+            'disqualified': self.disqualified,
+            'conversion_rate': won / total if total > 0 else 0,
+            'by_tier': {
+                tier: {
+                    'total': tier_total,
+                    'won': tier_won,
+                    'conversion_rate': tier_won / tier_total if tier_total else 0,
+                }
+                for tier, (tier_total, tier_won) in self.tier_counts.items()
+            },
+            'revenue': {
+                'total': round(total_revenue, 2),
+                'avg_deal_size': round(avg_deal_size, 2),
+                'total_cost': round(total_cost, 2),
+                'roi': round((total_revenue - total_cost) / total_cost if total_cost > 0 else 0, 2),
+            },
+            'timeline': {
+                'avg_days_to_close': round(avg_days_to_close, 1),
+                'fastest_deal': self.fastest_deal,
+                'slowest_deal': self.slowest_deal,
+            },
+        }
+
+
+# Recorders with open logs, closed at interpreter exit. Held weakly so a
+# recorder can still be collected (__del__ then closes its logs).
+_open_recorders: 'weakref.WeakSet[OutcomeRecorder]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_recorders():
+    for recorder in list(_open_recorders):
+        recorder.close()
+
 
 class OutcomeRecorder:
     """
@@ -140,10 +315,32 @@ class OutcomeRecorder:
         self.storage_dir = storage_dir or Path(__file__).parent.parent.parent / 'data' / 'outcomes'
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        self.outcomes = []  # In-memory cache
-        self._load_outcomes()
+        self.log_path = self.storage_dir / OUTCOME_LOG_NAME
+
+        # In-memory cache, loaded from storage on first read (see outcomes)
+        self._outcomes: Optional[List[Outcome]] = None
+        # Outcomes partitioned by trial branch (None for unbranched)
+        self._by_branch: Dict[Optional[str], List[Outcome]] = defaultdict(list)
+        # Conversion counters, overall and per trial branch
+        self._tally = _ConversionTally()
+        self._branch_tallies: Dict[str, _ConversionTally] = defaultdict(_ConversionTally)
+
+        # Per-branch log handles, opened on first write. Appends are
+        # buffered; flushed on close() or interpreter exit
+        self._log_fps: Dict[Optional[str], Any] = {}
+
+        logger.info("✓ Outcome Recorder initialized: %s", self.storage_dir)
+
+    @property
+    def outcomes(self) -> List[Outcome]:
+        """All recorded outcomes, loading history on first access"""
+        return self._ensure_loaded()
 
-        logger.info(f"✓ Outcome Recorder initialized: {self.storage_dir}")
+    def _ensure_loaded(self) -> List[Outcome]:
+        if self._outcomes is None:
+            self._outcomes = []
+            self._load_outcomes()
+        return self._outcomes
 
     def record_won(
         self,
@@ -171,8 +368,8 @@ class OutcomeRecorder:
 
         self._save_outcome(outcome)
         logger.info(
-            f"🎉 WON: {company_name} - ${deal_value:,.0f} "
-            f"({qualification_tier or 'unknown'} → {outcome.days_to_close}d)"
+            "🎉 WON: %s - $%.0f (%s → %sd)",
+            company_name, deal_value, qualification_tier or 'unknown', outcome.days_to_close
         )
 
         return outcome
@@ -210,15 +407,14 @@ class OutcomeRecorder:
 
         self._save_outcome(outcome)
         logger.info(
-            f"❌ LOST ({loss_type.value}): {company_name} - "
-            f"{qualification_tier or 'unknown'} tier "
-            f"({outcome.days_to_close}d)"
+            "❌ LOST (%s): %s - %s tier (%sd)",
+            loss_type.value, company_name, qualification_tier or 'unknown', outcome.days_to_close
         )
 
         if competitor_chosen:
-            logger.info(f"  → Lost to: {competitor_chosen}")
+            logger.info("  → Lost to: %s", competitor_chosen)
         if loss_reason:
-            logger.info(f"  → Reason: {loss_reason}")
+            logger.info("  → Reason: %s", loss_reason)
 
         return outcome
 
@@ -242,95 +438,114 @@ class OutcomeRecorder:
         )
 
         self._save_outcome(outcome)
-        logger.info(f"⛔ DISQUALIFIED: {company_name} (C={coherence_score:.2f})")
+        logger.info("⛔ DISQUALIFIED: %s (C=%.2f)", company_name, coherence_score)
 
         return outcome
 
     def _save_outcome(self, outcome: Outcome):
         """Save outcome to storage"""
-        self.outcomes.append(outcome)
-
-        # Save to JSON file
-        filename = f"{outcome.lead_id}_{outcome.outcome_type.value}.json"
-        filepath = self.storage_dir / filename
-
-        with open(filepath, 'w') as f:
-            json.dump(outcome.to_dict(), f, indent=2)
+        self._log_for(outcome.trial_branch).write(_json_bytes(outcome.to_dict()) + b'\n')
+        # Until history is loaded the log alone holds the record; the first
+        # read picks it up from there
+        if self._outcomes is not None:
+            self._add_outcome(outcome)
+
+    def _add_outcome(self, outcome: Outcome):
+        """Cache an outcome and fold it into the conversion counters"""
+        self._outcomes.append(outcome)
+        self._by_branch[outcome.trial_branch].append(outcome)
+        self._tally.add(outcome)
+        if outcome.trial_branch:
+            self._branch_tallies[outcome.trial_branch].add(outcome)
+
+    def _log_path_for(self, trial_branch: Optional[str]) -> Path:
+        if not trial_branch:
+            return self.log_path
+        return self.storage_dir / f"outcomes_{_UNSAFE_FILENAME_CHARS.sub('_', trial_branch)}.jsonl"
+
+    def _log_for(self, trial_branch: Optional[str]):
+        """Buffered append handle for a branch's log"""
+        fp = self._log_fps.get(trial_branch)
+        if fp is None:
+            if not self._log_fps:
+                _open_recorders.add(self)
+            fp = open(self._log_path_for(trial_branch), 'ab', buffering=1 << 16)
+            self._log_fps[trial_branch] = fp
+        return fp
+
+    def flush(self):
+        """Push buffered outcome records to disk"""
+        for fp in self._log_fps.values():
+            fp.flush()
+
+    def close(self):
+        """Flush and close the outcome logs"""
+        for fp in self._log_fps.values():
+            fp.close()
+        self._log_fps.clear()
+        _open_recorders.discard(self)
+
+    def __del__(self):
+        # Collected before exit: close the logs as the exit hook would
+        if getattr(self, '_log_fps', None):
+            self.close()
 
     def _load_outcomes(self):
         """Load existing outcomes from storage"""
         if not self.storage_dir.exists():
             return
 
+        # Records appended before the first read may still be buffered
+        self.flush()
+
+        # Legacy per-outcome files
         for filepath in self.storage_dir.glob('*.json'):
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    # Reconstruct Outcome object
-                    outcome = Outcome(**{
-                        k: v for k, v in data.items()
-                        if k not in ['is_won', 'is_lost', 'roi', 'days_to_close', 'learnings']
-                    })
-                    self.outcomes.append(outcome)
+                self._add_outcome(Outcome.from_dict(_json_loads(filepath.read_bytes())))
             except Exception as e:
-                logger.warning(f"Failed to load {filepath}: {e}")
+                logger.warning("Failed to load %s: %s", filepath, e)
+
+        for log_path in sorted(self.storage_dir.glob(OUTCOME_LOG_GLOB)):
+            self._load_log(log_path)
+
+        logger.info("  Loaded %d historical outcomes", len(self._outcomes))
+
+    def _load_log(self, log_path: Path):
+        """Load one JSONL outcome log"""
+        if not log_path.stat().st_size:
+            return
 
-        logger.info(f"  Loaded {len(self.outcomes)} historical outcomes")
+        # Map the log and slice records straight out of the mapping
+        # instead of reading it through a line iterator
+        with open(log_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, end, lineno = 0, len(mm), 0
+            while pos < end:
+                nl = mm.find(b'\n', pos)
+                if nl == -1:
+                    nl = end
+                lineno += 1
+                record = mm[pos:nl]
+                pos = nl + 1
+                if not record.strip():
+                    continue
+                try:
+                    self._add_outcome(Outcome.from_dict(_json_loads(record)))
+                except Exception as e:
+                    logger.warning("Failed to load %s:%s: %s", log_path, lineno, e)
 
     def get_conversion_metrics(self, trial_branch: Optional[str] = None) -> Dict[str, Any]:
         """Calculate conversion and revenue metrics"""
-        outcomes = self.outcomes
+        self._ensure_loaded()
         if trial_branch:
-            outcomes = [o for o in outcomes if o.trial_branch == trial_branch]
+            tally = self._branch_tallies.get(trial_branch)
+        else:
+            tally = self._tally
 
-        if not outcomes:
+        if tally is None or not tally.total:
             return {'error': 'No outcomes recorded'}
 
-        total = len(outcomes)
-        won = [o for o in outcomes if o.is_won]
-        lost = [o for o in outcomes if o.is_lost]
-        disqualified = [o for o in outcomes if o.is_disqualified]
-
-        # By qualification tier
-        by_tier = {}
-        for tier in ['hot', 'warm', 'cold', 'disqualified']:
-            tier_outcomes = [o for o in outcomes if o.qualification_tier == tier]
-            tier_won = [o for o in tier_outcomes if o.is_won]
-            by_tier[tier] = {
-                'total': len(tier_outcomes),
-                'won': len(tier_won),
-                'conversion_rate': len(tier_won) / len(tier_outcomes) if tier_outcomes else 0,
-            }
-
-        # Financial
-        total_revenue = sum(o.deal_value for o in won)
-        total_cost = sum(o.cost_to_acquire for o in outcomes if o.cost_to_acquire > 0)
-        avg_deal_size = total_revenue / len(won) if won else 0
-
-        # Timeline
-        days_to_close = [o.days_to_close for o in won if o.days_to_close]
-        avg_days_to_close = sum(days_to_close) / len(days_to_close) if days_to_close else 0
-
-        return {
-            'total_outcomes': total,
-            'won': len(won),
-            'lost': len(lost),
-            'disqualified': len(disqualified),
-            'conversion_rate': len(won) / total if total > 0 else 0,
-            'by_tier': by_tier,
-            'revenue': {
-                'total': round(total_revenue, 2),
-                'avg_deal_size': round(avg_deal_size, 2),
-                'total_cost': round(total_cost, 2),
-                'roi': round((total_revenue - total_cost) / total_cost if total_cost > 0 else 0, 2),
-            },
-            'timeline': {
-                'avg_days_to_close': round(avg_days_to_close, 1),
-                'fastest_deal': min(days_to_close) if days_to_close else None,
-                'slowest_deal': max(days_to_close) if days_to_close else None,
-            },
-            'trial_branch': trial_branch,
-        }
+        return {**tally.metrics(), 'trial_branch': trial_branch}
 
     def get_graveyard_nutrients(self) -> List[Dict[str, Any]]:
         """
@@ -342,7 +557,7 @@ class OutcomeRecorder:
 
         lost_and_disqualified = [
             o for o in self.outcomes
-            if o.is_lost or o.is_disqualified
+            if o.outcome_type in _NUTRIENT_OUTCOMES
         ]
 
         for outcome in lost_and_disqualified:
@@ -366,19 +581,27 @@ class OutcomeRecorder:
         metrics = self.get_conversion_metrics(trial_branch=trial_branch)
         nutrients = self.get_graveyard_nutrients()
 
-        with open(filepath, 'w') as f:
-            json.dump({
-                'trial_branch': trial_branch,
-                'metrics': metrics,
-                'nutrients': nutrients,
-                'outcomes': [o.to_dict() for o in self.outcomes if o.trial_branch == trial_branch],
-            }, f, indent=2)
+        # Stream the outcome list record by record rather than building the
+        # whole export in memory
+        with open(filepath, 'wb', buffering=1 << 18) as f:
+            f.write(b'{"trial_branch":' + _json_bytes(trial_branch))
+            f.write(b',\n"metrics":' + _json_bytes(metrics))
+            f.write(b',\n"nutrients":' + _json_bytes(nutrients))
+            f.write(b',\n"outcomes":[')
+            sep = b'\n'
+            for o in self._by_branch.get(trial_branch, ()):
+                f.write(sep)
+                f.write(_json_bytes(o.to_dict()))
+                sep = b',\n'
+            f.write(b'\n]}\n')
 
-        logger.info(f"✓ Exported trial outcomes: {filepath}")
+        logger.info("✓ Exported trial outcomes: %s", filepath)
 
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     recorder = OutcomeRecorder()
 
     print("\n" + "=" * 60)
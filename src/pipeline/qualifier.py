@@ -9,20 +9,41 @@ Routes leads based on coherence scores and signals detected.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import logging
 import json
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import core components
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from core.rose_glass_lens import RoseGlassCRMLens, LeadData, LeadCoherence
+try:
+    from ..core.rose_glass_lens import RoseGlassCRMLens, LeadData, LeadCoherence
+except ImportError:  # Loaded as top-level 'pipeline' package (src/ on sys.path)
+    from core.rose_glass_lens import RoseGlassCRMLens, LeadData, LeadCoherence
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Base routing priority per qualification tier
+_BASE_PRIORITY = {
+    'hot': 1.0,
+    'warm': 0.6,
+    'cold': 0.3,
+    'disqualified': 0.0,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class QualificationResult:
     """Result of qualifying a lead through Rose Glass"""
 
@@ -48,7 +69,36 @@ class QualificationResult:
     # Trial tracking
     trial_branch: Optional[str] = None  # 'classic' or 'experimental_X'
 
+    # First to_dict() result; reset whenever another field is assigned
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
+
     def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialized form, built once; each call gets its own copy of the
+        dicts, so callers may modify what they're given.
+        """
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._dict_cache = self._build_dict()
+
+        coherence = cache['coherence']
+        return {
+            **cache,
+            'coherence': {
+                **coherence,
+                'dimensions': dict(coherence['dimensions']),
+                'signals': dict(coherence['signals']),
+            },
+        }
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             'lead_id': self.lead_id,
             'company_name': self.company_name,
@@ -91,7 +141,9 @@ class LeadQualifier:
             'disqualified': 0,
         }
 
-        logger.info(f"✓ Lead Qualifier initialized: lens={lens_name}, branch={self.trial_branch}")
+        logger.info(
+            "✓ Lead Qualifier initialized: lens=%s, branch=%s", lens_name, self.trial_branch
+        )
 
     def qualify(self, lead: LeadData) -> QualificationResult:
         """
@@ -99,7 +151,7 @@ class LeadQualifier:
 
         Returns QualificationResult with routing decision.
         """
-        logger.info(f"🔍 Qualifying: {lead.company_name} (ID: {lead.lead_id})")
+        logger.info("🔍 Qualifying: %s (ID: %s)", lead.company_name, lead.lead_id)
 
         # Perceive through Rose Glass
         coherence = self.lens.perceive(lead)
@@ -129,19 +181,19 @@ class LeadQualifier:
 
         # Log decision
         logger.info(
-            f"  → {result.qualification_tier.upper()}: "
-            f"C={coherence.coherence_score:.2f} "
-            f"(Ψ={coherence.psi_intent:.2f}, ρ={coherence.rho_authority:.2f}, "
-            f"q={coherence.q_urgency:.2f}, f={coherence.f_fit:.2f}) "
-            f"→ {result.next_stage}"
+            "  → %s: C=%.2f (Ψ=%.2f, ρ=%.2f, q=%.2f, f=%.2f) → %s",
+            result.qualification_tier.upper(), coherence.coherence_score,
+            coherence.psi_intent, coherence.rho_authority,
+            coherence.q_urgency, coherence.f_fit, result.next_stage
         )
 
-        if coherence.positive_signals:
-            logger.info(f"  ✓ Signals: {', '.join(coherence.positive_signals[:3])}")
-        if coherence.warning_signals:
-            logger.info(f"  ⚠️  Warnings: {', '.join(coherence.warning_signals[:2])}")
-        if coherence.disqualifiers:
-            logger.info(f"  ❌ Disqualifiers: {', '.join(coherence.disqualifiers)}")
+        if logger.isEnabledFor(logging.INFO):
+            if coherence.positive_signals:
+                logger.info("  ✓ Signals: %s", ', '.join(coherence.positive_signals[:3]))
+            if coherence.warning_signals:
+                logger.info("  ⚠️  Warnings: %s", ', '.join(coherence.warning_signals[:2]))
+            if coherence.disqualifiers:
+                logger.info("  ❌ Disqualifiers: %s", ', '.join(coherence.disqualifiers))
 
         return result
 
@@ -151,25 +203,37 @@ class LeadQualifier:
 
         Returns sorted results (hot first, then warm, cold, disqualified).
         """
-        logger.info(f"📋 Batch qualification: {len(leads)} leads")
+        logger.info("📋 Batch qualification: %d leads", len(leads))
 
         results = []
+        scores = np.empty(len(leads)) if NUMPY_AVAILABLE else None
+        qualify = self.qualify
+        append = results.append
+        n = 0
         for lead in leads:
             try:
-                result = self.qualify(lead)
-                results.append(result)
+                result = qualify(lead)
             except Exception as e:
-                logger.error(f"  Failed to qualify {lead.company_name}: {e}")
-
-        # Sort by priority
-        results.sort(key=lambda r: r.priority_score, reverse=True)
+                logger.error("  Failed to qualify %s: %s", lead.company_name, e)
+                continue
+            if scores is not None:
+                scores[n] = result.priority_score
+            append(result)
+            n += 1
+
+        # Sort by priority (stable: equal scores keep input order)
+        if scores is not None:
+            order = np.argsort(-scores[:n], kind='stable')
+            results = [results[i] for i in order]
+        else:
+            results.sort(key=lambda r: r.priority_score, reverse=True)
 
         # Summary
-        logger.info(f"\n📊 Batch Summary:")
-        logger.info(f"  HOT: {self.stats['hot']} ({self.stats['hot']/len(leads)*100:.1f}%)")
-        logger.info(f"  WARM: {self.stats['warm']} ({self.stats['warm']/len(leads)*100:.1f}%)")
-        logger.info(f"  COLD: {self.stats['cold']} ({self.stats['cold']/len(leads)*100:.1f}%)")
-        logger.info(f"  DISQUALIFIED: {self.stats['disqualified']} ({self.stats['disqualified']/len(leads)*100:.1f}%)")
+        if leads and logger.isEnabledFor(logging.INFO):
+            logger.info("\n📊 Batch Summary:")
+            for tier in ('hot', 'warm', 'cold', 'disqualified'):
+                count = self.stats[tier]
+                logger.info("  %s: %s (%.1f%%)", tier.upper(), count, count / len(leads) * 100)
 
         return results
 
@@ -192,12 +256,7 @@ class LeadQualifier:
 
         Hot leads with high urgency get highest priority.
         """
-        base_priority = {
-            'hot': 1.0,
-            'warm': 0.6,
-            'cold': 0.3,
-            'disqualified': 0.0,
-        }.get(coherence.qualification_tier, 0.0)
+        base_priority = _BASE_PRIORITY.get(coherence.qualification_tier, 0.0)
 
         # Boost priority based on urgency and authority
         urgency_boost = coherence.q_urgency * 0.2
@@ -227,18 +286,37 @@ class LeadQualifier:
 
     def export_log(self, filepath: Path):
         """Export qualification log to JSON (for trial analysis)"""
-        with open(filepath, 'w') as f:
-            json.dump({
-                'stats': self.get_stats(),
-                'qualifications': self.qualification_log,
-            }, f, indent=2)
+        payload = {
+            'stats': self.get_stats(),
+            'qualifications': self.qualification_log,
+        }
+        if ORJSON_AVAILABLE:
+            Path(filepath).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(payload, f, indent=2)
 
-        logger.info(f"✓ Exported qualification log: {filepath}")
+        logger.info("✓ Exported qualification log: %s", filepath)
+
+
+@lru_cache(maxsize=32)
+def get_qualifier(
+    lens_name: str = 'enterprise_saas',
+    trial_branch: str = 'classic'
+) -> LeadQualifier:
+    """
+    Shared LeadQualifier per (lens_name, trial_branch), so each lens is
+    loaded once per process.
+
+    The instance's qualification log and stats are shared by every caller;
+    construct LeadQualifier directly for an isolated one.
+    """
+    return LeadQualifier(lens_name=lens_name, trial_branch=trial_branch)
 
 
 # Example usage
 if __name__ == "__main__":
-    from core.rose_glass_lens import LeadData
+    logging.basicConfig(level=logging.INFO)
 
     # Create qualifier
     qualifier = LeadQualifier(lens_name='enterprise_saas', trial_branch='classic')
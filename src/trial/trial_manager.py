@@ -9,17 +9,200 @@ the classic (current standard). Winners become the new standard.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
+import atexit
+import copy
 import logging
 import json
+import math
+import os
 import random
+import threading
+import weakref
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Uniform samples drawn per refill for bulk branch assignment
+_RAND_BUFFER_SIZE = 16384
+
+# Reader threads for _load_trials when ROSE_GLASS_PARALLEL_LOAD=1
+_PARALLEL_LOAD_WORKERS = 8
+
+# Logged events after which a trial is snapshotted and its log truncated
+_SNAPSHOT_EVERY = 1000
+
+# Below this expected won/lost count in any cell the z-test's normal
+# approximation is unreliable and a permutation test is used instead
+_MIN_EXPECTED_COUNT = 5
+_PERMUTATION_RESAMPLES = 10000
+
+# Compact stdlib JSON encoding (no indent, no separator padding)
+_COMPACT = dict(separators=(',', ':'))
+
+# TrialBranch counter for each qualification tier
+_TIER_ATTRS = {
+    'hot': 'leads_hot',
+    'warm': 'leads_warm',
+    'cold': 'leads_cold',
+    'disqualified': 'leads_disqualified',
+}
+
+
+def _dump_json_atomic(filepath: Path, obj: Any, pretty: bool = False):
+    """Write JSON (compact unless pretty) to a temp file and swap it into place"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        data = json.dumps(obj, indent=2).encode()
+    else:
+        data = json.dumps(obj, **_COMPACT).encode()
+
+    tmp_path = filepath.with_name(filepath.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file (orjson when available)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_line(obj: Any) -> bytes:
+    """Compact JSON for one event-log line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, **_COMPACT).encode() + b'\n'
+
+
+def _two_proportion_confidence(won_a: int, n_a: int, won_b: int, n_b: int) -> float:
+    """
+    Confidence (1 - two-sided p-value) that two conversion rates differ,
+    from a pooled two-proportion z-test.
+    """
+    if n_a == 0 or n_b == 0:
+        return 0.0
+
+    pooled = (won_a + won_b) / (n_a + n_b)
+    variance = pooled * (1 - pooled) * (1 / n_a + 1 / n_b)
+    if variance <= 0:
+        return 0.0
+
+    z = (won_b / n_b - won_a / n_a) / math.sqrt(variance)
+    # Two-sided p-value from the normal tail: P(|Z| > |z|) = erfc(|z| / sqrt(2))
+    return 1.0 - math.erfc(abs(z) / math.sqrt(2))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _permutation_extreme_count(won_total, n_a, n_b, observed, resamples):
+        """
+        Count label permutations whose conversion-rate gap is at least as
+        large as the observed one.
+
+        Each resample reshuffles the pooled won/lost outcomes and deals the
+        first n_a of them to branch A (partial Fisher-Yates).
+        """
+        n = n_a + n_b
+        extreme = 0
+
+        for i in prange(resamples):
+            outcomes = np.zeros(n, dtype=np.int8)
+            outcomes[:won_total] = 1
+            won_a = 0
+            for j in range(n_a):
+                k = np.random.randint(j, n)
+                tmp = outcomes[j]
+                outcomes[j] = outcomes[k]
+                outcomes[k] = tmp
+                won_a += outcomes[j]
+
+            diff = (won_total - won_a) / n_b - won_a / n_a
+            if abs(diff) >= observed - 1e-12:
+                extreme += 1
+
+        return extreme
+
+
+def _permutation_confidence(won_a: int, n_a: int, won_b: int, n_b: int,
+                            resamples: int = _PERMUTATION_RESAMPLES) -> float:
+    """Confidence (1 - two-sided p-value) from a Numba permutation test"""
+    if n_a == 0 or n_b == 0:
+        return 0.0
+
+    observed = abs(won_b / n_b - won_a / n_a)
+    extreme = _permutation_extreme_count(won_a + won_b, n_a, n_b, observed, resamples)
+    return 1.0 - (extreme + 1) / (resamples + 1)
+
+
+def _needs_exact_test(won_a: int, n_a: int, won_b: int, n_b: int) -> bool:
+    """True if any expected won/lost cell count is too small for the z-test"""
+    n = n_a + n_b
+    if n == 0:
+        return False
+    won = won_a + won_b
+    smallest = min(n_a, n_b) * min(won, n - won) / n
+    return smallest < _MIN_EXPECTED_COUNT
+
+
+class _UniformBuffer:
+    """
+    Uniform [0, 1) samples drawn _RAND_BUFFER_SIZE at a time, shared by
+    single and bulk branch assignment so both consume one stream.
+    """
+
+    __slots__ = ('_rng', '_buf', '_idx', '_lock')
+
+    def __init__(self):
+        self._rng = np.random.default_rng() if NUMPY_AVAILABLE else random.Random()
+        self._buf = np.empty(0) if NUMPY_AVAILABLE else []
+        self._idx = 0
+        self._lock = threading.Lock()
+
+    def draw(self, n: int):
+        """Next n samples (an array, or a list without numpy)"""
+        with self._lock:
+            if n > len(self._buf) - self._idx:
+                if n > _RAND_BUFFER_SIZE:
+                    return self._fresh(n)
+                self._buf = self._fresh(_RAND_BUFFER_SIZE)
+                self._idx = 0
+
+            start = self._idx
+            self._idx = start + n
+            return self._buf[start:start + n]
+
+    def _fresh(self, n: int):
+        if NUMPY_AVAILABLE:
+            return self._rng.random(n)
+        return [self._rng.random() for _ in range(n)]
+
 
 class TrialStatus(Enum):
     """Trial lifecycle states"""
@@ -31,7 +214,7 @@ class TrialStatus(Enum):
     ARCHIVED = 'archived'  # Experimental lost
 
 
-@dataclass
+@dataclass(slots=True)
 class TrialBranch:
     """
     One branch of a trial (either classic or experimental).
@@ -57,37 +240,83 @@ class TrialBranch:
     total_revenue: float = 0.0
     total_cost: float = 0.0
 
+    # Last derived metrics, keyed by the counters they were computed from
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def counters_tuple(self) -> tuple:
+        """All raw counters: seven counts, then revenue and cost"""
+        return (
+            self.leads_qualified, self.leads_hot, self.leads_warm,
+            self.leads_cold, self.leads_disqualified,
+            self.outcomes_won, self.outcomes_lost,
+            self.total_revenue, self.total_cost,
+        )
+
+    def _counter_key(self) -> tuple:
+        return (
+            self.leads_qualified, self.leads_disqualified,
+            self.outcomes_won, self.outcomes_lost,
+            self.total_revenue, self.total_cost,
+        )
+
+    def _derived(self) -> tuple:
+        """
+        (qualification_rate, conversion_rate, avg_deal_value, roi, fitness_score),
+        recomputed only when a counter has changed since the last call.
+        """
+        key = self._counter_key()
+        cache = self._cache
+        if cache.get('key') == key:
+            return cache['derived']
+
+        leads_qualified, leads_disqualified, won, lost, revenue, cost = key
+
+        # % of leads that weren't disqualified
+        qualification_rate = (
+            (leads_qualified - leads_disqualified) / leads_qualified if leads_qualified else 0.0
+        )
+        # % of qualified leads that won
+        total_outcomes = won + lost
+        conversion_rate = won / total_outcomes if total_outcomes else 0.0
+        # Average revenue per won deal
+        avg_deal_value = revenue / won if won else 0.0
+        # Return on investment
+        roi = (revenue - cost) / cost if cost else 0.0
+
+        # Fitness: qualification_rate * 0.3 + conversion_rate * 0.5 + revenue_weight * 0.2
+        # Revenue weight (normalized to 0-1, capped at $100k avg)
+        revenue_weight = min(avg_deal_value / 100000, 1.0)
+        fitness = (
+            qualification_rate * 0.3 +
+            conversion_rate * 0.5 +
+            revenue_weight * 0.2
+        )
+
+        derived = (qualification_rate, conversion_rate, avg_deal_value, roi, fitness)
+        cache['key'] = key
+        cache['derived'] = derived
+        return derived
+
     # Derived metrics
     @property
     def qualification_rate(self) -> float:
         """% of leads that weren't disqualified"""
-        total = self.leads_qualified
-        if total == 0:
-            return 0.0
-        qualified = total - self.leads_disqualified
-        return qualified / total
+        return self._derived()[0]
 
     @property
     def conversion_rate(self) -> float:
         """% of qualified leads that won"""
-        total_outcomes = self.outcomes_won + self.outcomes_lost
-        if total_outcomes == 0:
-            return 0.0
-        return self.outcomes_won / total_outcomes
+        return self._derived()[1]
 
     @property
     def avg_deal_value(self) -> float:
         """Average revenue per won deal"""
-        if self.outcomes_won == 0:
-            return 0.0
-        return self.total_revenue / self.outcomes_won
+        return self._derived()[2]
 
     @property
     def roi(self) -> float:
         """Return on investment"""
-        if self.total_cost == 0:
-            return 0.0
-        return (self.total_revenue - self.total_cost) / self.total_cost
+        return self._derived()[3]
 
     @property
     def fitness_score(self) -> float:
@@ -96,18 +325,10 @@ class TrialBranch:
 
         Formula: qualification_rate * 0.3 + conversion_rate * 0.5 + revenue_weight * 0.2
         """
-        # Revenue weight (normalized to 0-1, capped at $100k avg)
-        revenue_weight = min(self.avg_deal_value / 100000, 1.0)
-
-        fitness = (
-            self.qualification_rate * 0.3 +
-            self.conversion_rate * 0.5 +
-            revenue_weight * 0.2
-        )
-
-        return fitness
+        return self._derived()[4]
 
     def to_dict(self) -> Dict[str, Any]:
+        qualification_rate, conversion_rate, avg_deal_value, roi, fitness = self._derived()
         return {
             'name': self.name,
             'description': self.description,
@@ -124,16 +345,26 @@ class TrialBranch:
                 'total_cost': round(self.total_cost, 2),
             },
             'derived': {
-                'qualification_rate': round(self.qualification_rate, 3),
-                'conversion_rate': round(self.conversion_rate, 3),
-                'avg_deal_value': round(self.avg_deal_value, 2),
-                'roi': round(self.roi, 2),
-                'fitness_score': round(self.fitness_score, 3),
+                'qualification_rate': round(qualification_rate, 3),
+                'conversion_rate': round(conversion_rate, 3),
+                'avg_deal_value': round(avg_deal_value, 2),
+                'roi': round(roi, 2),
+                'fitness_score': round(fitness, 3),
             }
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TrialBranch':
+        """Rebuild a branch from its to_dict() form"""
+        return cls(
+            name=data['name'],
+            description=data.get('description', ''),
+            config=data.get('config', {}),
+            **data.get('metrics', {}),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Trial:
     """
     A trial comparing classic approach vs experimental approach.
@@ -161,6 +392,23 @@ class Trial:
     winner: Optional[str] = None  # 'classic' or 'experimental'
     confidence: Optional[float] = None
 
+    # Last significance test: (outcome counters, confidence)
+    _confidence_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    # Last evaluation and the branch counters it was computed from
+    _last_eval_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _last_eval_result: Optional['TrialResult'] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # (started_at, completed_at, started_at iso, completed_at iso) as last serialized
+    _iso_cache: tuple = field(
+        default=(None, None, None, None), init=False, repr=False, compare=False
+    )
+
+    # The managing TrialManager's sample buffer (set on registration)
+    _uniforms: Optional[_UniformBuffer] = field(default=None, init=False, repr=False, compare=False)
+
     def start(self):
         """Start the trial"""
         self.status = TrialStatus.RUNNING
@@ -189,17 +437,26 @@ class Trial:
         if self.status != TrialStatus.RUNNING:
             return 'classic'  # Default to classic if trial not running
 
-        # Randomized assignment based on traffic_split
-        return 'experimental' if random.random() < self.traffic_split else 'classic'
+        # Randomized assignment based on traffic_split, from the same
+        # sample stream as TrialManager.assign_bulk
+        u = self._uniforms.draw(1)[0] if self._uniforms is not None else random.random()
+        return 'experimental' if u < self.traffic_split else 'classic'
 
     def to_dict(self) -> Dict[str, Any]:
+        # Timestamps only change on start/archive; re-format them only then
+        started_at, completed_at, started_iso, completed_iso = self._iso_cache
+        if started_at is not self.started_at or completed_at is not self.completed_at:
+            started_iso = self.started_at.isoformat() if self.started_at else None
+            completed_iso = self.completed_at.isoformat() if self.completed_at else None
+            self._iso_cache = (self.started_at, self.completed_at, started_iso, completed_iso)
+
         return {
             'trial_id': self.trial_id,
             'name': self.name,
             'description': self.description,
             'status': self.status.value,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'started_at': started_iso,
+            'completed_at': completed_iso,
             'traffic_split': self.traffic_split,
             'min_sample_size': self.min_sample_size,
             'classic_branch': self.classic_branch.to_dict(),
@@ -208,8 +465,28 @@ class Trial:
             'confidence': round(self.confidence, 3) if self.confidence else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Trial':
+        """Rebuild a trial from its to_dict() form"""
+        started_at = data.get('started_at')
+        completed_at = data.get('completed_at')
+        return cls(
+            trial_id=data['trial_id'],
+            name=data['name'],
+            description=data.get('description', ''),
+            classic_branch=TrialBranch.from_dict(data['classic_branch']),
+            experimental_branch=TrialBranch.from_dict(data['experimental_branch']),
+            traffic_split=data.get('traffic_split', 0.5),
+            min_sample_size=data.get('min_sample_size', 50),
+            status=TrialStatus(data.get('status', TrialStatus.PLANNED.value)),
+            started_at=datetime.fromisoformat(started_at) if started_at else None,
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            winner=data.get('winner'),
+            confidence=data.get('confidence'),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class TrialResult:
     """Results of trial evaluation"""
 
@@ -240,6 +517,20 @@ class TrialResult:
         }
 
 
+# Managers not yet closed, snapshotted at interpreter exit. Held weakly so
+# short-lived managers can still be collected.
+_live_managers: 'weakref.WeakSet[TrialManager]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_managers():
+    for manager in list(_live_managers):
+        try:
+            manager.close()
+        except OSError as e:  # e.g. storage_dir already removed
+            logger.warning(f"Could not snapshot trials in {manager.storage_dir}: {e}")
+
+
 class TrialManager:
     """
     Manages trials for system evolution.
@@ -256,8 +547,29 @@ class TrialManager:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.trials: List[Trial] = []
+        self._trials_by_id: Dict[str, Trial] = {}
         self.standards_history: List[Dict] = []  # History of promoted approaches
 
+        # Pre-drawn uniform samples for assign_bulk and Trial.assign_branch
+        self._uniforms = _UniformBuffer()
+
+        # Parsed current_standard.json as (st_mtime_ns, config)
+        self._std_cache: Optional[tuple] = None
+
+        # Append-only event logs ({trial_id}.log), opened on first event,
+        # and the number of events logged per trial since its last snapshot
+        self._logs: Dict[str, Any] = {}
+        self._unsnapshotted: Dict[str, int] = {}
+
+        # Sequence number of the last event logged per trial. Snapshots
+        # record it as 'log_seq' so replay can skip events they include.
+        self._log_seq: Dict[str, int] = {}
+
+        # One lock per trial guards its counters, log and snapshot, so
+        # concurrent recorders only contend within the same trial
+        self._trial_locks: Dict[str, threading.RLock] = {}
+        _live_managers.add(self)
+
         self._load_trials()
 
         logger.info(f"✓ Trial Manager initialized: {self.storage_dir}")
@@ -306,7 +618,7 @@ class TrialManager:
             min_sample_size=min_sample_size,
         )
 
-        self.trials.append(trial)
+        self._register_trial(trial)
         self._save_trial(trial)
 
         logger.info(f"🧪 Created trial: {name} ({trial_id})")
@@ -314,6 +626,24 @@ class TrialManager:
 
         return trial
 
+    def assign_bulk(self, trial: Trial, n: int):
+        """
+        Assign n incoming leads to branches at once.
+
+        Returns a boolean array (a list without numpy), True where the lead
+        goes to the experimental branch. Same rules and sample stream as
+        Trial.assign_branch.
+        """
+        if trial.status != TrialStatus.RUNNING:
+            return np.zeros(n, dtype=bool) if NUMPY_AVAILABLE else [False] * n
+
+        samples = self._uniforms.draw(n)
+        if not NUMPY_AVAILABLE:
+            split = trial.traffic_split
+            return [u < split for u in samples]
+
+        return samples < trial.traffic_split
+
     def record_qualification(
         self,
         trial_id: str,
@@ -325,22 +655,7 @@ class TrialManager:
         if not trial:
             return
 
-        branch_obj = self._get_branch(trial, branch)
-        if not branch_obj:
-            return
-
-        branch_obj.leads_qualified += 1
-
-        if tier == 'hot':
-            branch_obj.leads_hot += 1
-        elif tier == 'warm':
-            branch_obj.leads_warm += 1
-        elif tier == 'cold':
-            branch_obj.leads_cold += 1
-        elif tier == 'disqualified':
-            branch_obj.leads_disqualified += 1
-
-        self._save_trial(trial)
+        self._record(trial, [{'t': 'q', 'b': self._branch_code(branch), 'tier': str(tier)}])
 
     def record_outcome(
         self,
@@ -355,29 +670,172 @@ class TrialManager:
         if not trial:
             return
 
-        branch_obj = self._get_branch(trial, branch)
-        if not branch_obj:
+        won = outcome_type == 'won'
+        self._record(trial, [{
+            't': 'o', 'b': self._branch_code(branch),
+            'w': int(won), 'l': int(not won),
+            'v': float(deal_value) if won else 0.0, 'c': float(cost),
+        }])
+
+    def record_qualifications_bulk(
+        self,
+        trial_id: str,
+        branches: Iterable[Any],
+        tiers: Iterable[str]
+    ):
+        """
+        Record many lead qualifications at once.
+
+        branches holds branch names (as for record_qualification) or the
+        booleans returned by assign_bulk (True = experimental); tiers holds
+        the matching tier strings. Counts are tallied in one pass and logged
+        as one event per branch and tier.
+        """
+        trial = self._get_trial(trial_id)
+        if not trial:
             return
 
-        if outcome_type == 'won':
-            branch_obj.outcomes_won += 1
-            branch_obj.total_revenue += deal_value
-        else:
-            branch_obj.outcomes_lost += 1
+        counts = Counter(zip(map(self._is_experimental, branches), tiers))
+        self._record(trial, [
+            {'t': 'q', 'b': 'e' if is_experimental else 'c', 'tier': str(tier), 'n': n}
+            for (is_experimental, tier), n in counts.items()
+        ])
 
-        branch_obj.total_cost += cost
-        self._save_trial(trial)
+    def record_outcomes_bulk(
+        self,
+        trial_id: str,
+        branches: Iterable[Any],
+        outcome_types: Iterable[str],
+        deal_values: Optional[Iterable[float]] = None,
+        costs: Optional[Iterable[float]] = None
+    ):
+        """
+        Record many lead outcomes at once.
+
+        Arguments are parallel sequences, as for record_outcome; branches
+        may also be assign_bulk booleans. Missing deal_values/costs count
+        as 0.
+        """
+        trial = self._get_trial(trial_id)
+        if not trial:
+            return
+
+        outcome_types = list(outcome_types)
+        n = len(outcome_types)
+        if deal_values is None:
+            deal_values = [0.0] * n
+        if costs is None:
+            costs = [0.0] * n
+
+        # Per branch: [won, lost, revenue, cost]
+        totals = {False: [0, 0, 0.0, 0.0], True: [0, 0, 0.0, 0.0]}
+        for is_experimental, outcome_type, deal_value, cost in zip(
+            map(self._is_experimental, branches), outcome_types, deal_values, costs
+        ):
+            # float() so numpy inputs leave plain floats for the event log
+            t = totals[is_experimental]
+            if outcome_type == 'won':
+                t[0] += 1
+                t[2] += float(deal_value)
+            else:
+                t[1] += 1
+            t[3] += float(cost)
+
+        self._record(trial, [
+            {'t': 'o', 'b': 'e' if is_experimental else 'c',
+             'w': won, 'l': lost, 'v': revenue, 'c': cost}
+            for is_experimental, (won, lost, revenue, cost) in totals.items()
+            if won or lost
+        ])
+
+    def _record(self, trial: Trial, events: List[Dict[str, Any]]):
+        """Apply events to the trial's counters and append them to its log"""
+        if not events:
+            return
+
+        trial_id = trial.trial_id
+
+        with self._trial_locks[trial_id]:
+            fp = self._logs.get(trial_id)
+            if fp is None:
+                fp = open(self.storage_dir / f"{trial_id}.log", 'ab', buffering=1 << 16)
+                self._logs[trial_id] = fp
+
+            # Serialize and write before touching the counters, so an event
+            # that fails to encode or reach the log is not counted either
+            seq = self._log_seq.get(trial_id, 0)
+            for event in events:
+                seq += 1
+                event['s'] = seq
+            fp.write(b''.join(map(_json_line, events)))
+
+            for event in events:
+                self._apply_event(trial, event)
+            self._log_seq[trial_id] = seq
+
+            pending = self._unsnapshotted.get(trial_id, 0) + len(events)
+            if pending >= _SNAPSHOT_EVERY:
+                self._save_trial(trial)
+            else:
+                self._unsnapshotted[trial_id] = pending
+
+    @staticmethod
+    def _apply_event(trial: Trial, event: Dict[str, Any]):
+        """Add one logged qualification ('q') or outcome ('o') event to the counters"""
+        branch_obj = trial.experimental_branch if event['b'] == 'e' else trial.classic_branch
+        if event['t'] == 'q':
+            n = event.get('n', 1)
+            branch_obj.leads_qualified += n
+            attr = _TIER_ATTRS.get(event['tier'])
+            if attr:
+                setattr(branch_obj, attr, getattr(branch_obj, attr) + n)
+        else:
+            branch_obj.outcomes_won += event['w']
+            branch_obj.outcomes_lost += event['l']
+            branch_obj.total_revenue += event['v']
+            branch_obj.total_cost += event['c']
+
+    @classmethod
+    def _branch_code(cls, branch: Any) -> str:
+        """Branch name or assign_bulk flag -> event-log branch code"""
+        return 'e' if cls._is_experimental(branch) else 'c'
+
+    @staticmethod
+    def _is_experimental(branch: Any) -> bool:
+        """Branch name or assign_bulk flag -> True for the experimental branch"""
+        if isinstance(branch, str):
+            return 'classic' not in branch.lower()
+        return bool(branch)
 
     def evaluate_trial(self, trial_id: str) -> Optional[TrialResult]:
         """
         Evaluate a trial and determine winner.
 
-        Returns TrialResult with recommendation.
+        Returns TrialResult with recommendation. Re-evaluating with no new
+        events recorded returns the previous result.
         """
         trial = self._get_trial(trial_id)
         if not trial:
             return None
 
+        # Counters can't move under the evaluation; other trials aren't blocked
+        with self._trial_locks[trial_id]:
+            return self._evaluate(trial)
+
+    def _evaluate(self, trial: Trial) -> Optional[TrialResult]:
+        """evaluate_trial body, run holding the trial's lock"""
+        trial_id = trial.trial_id
+        eval_key = (
+            trial.classic_branch.counters_tuple(),
+            trial.experimental_branch.counters_tuple(),
+        )
+        if eval_key == trial._last_eval_key:
+            return trial._last_eval_result
+
+        fp = self._logs.get(trial_id)
+        if fp is not None:
+            fp.flush()
+
         if not trial.is_ready_for_evaluation():
             logger.warning(
                 f"Trial {trial_id} not ready for evaluation - "
@@ -440,6 +898,8 @@ class TrialManager:
         self._save_trial(trial)
         self._save_result(result)
 
+        trial._last_eval_key = eval_key
+        trial._last_eval_result = result
         return result
 
     def promote_experimental(self, trial_id: str):
@@ -456,6 +916,8 @@ class TrialManager:
             logger.warning(f"Cannot promote - experimental is not the winner")
             return
 
+        self.flush()
+
         # Archive old standard
         old_standard = self._get_current_standard()
         self.standards_history.append({
@@ -495,49 +957,62 @@ class TrialManager:
                 return trial
         return None
 
+    def _register_trial(self, trial: Trial):
+        """Track a created or loaded trial"""
+        self.trials.append(trial)
+        self._trials_by_id.setdefault(trial.trial_id, trial)
+        trial._uniforms = self._uniforms
+        self._trial_locks.setdefault(trial.trial_id, threading.RLock())
+
     def _get_trial(self, trial_id: str) -> Optional[Trial]:
         """Find trial by ID"""
-        for trial in self.trials:
-            if trial.trial_id == trial_id:
-                return trial
-        return None
-
-    def _get_branch(self, trial: Trial, branch_name: str) -> Optional[TrialBranch]:
-        """Get branch from trial"""
-        if 'classic' in branch_name.lower():
-            return trial.classic_branch
-        else:
-            return trial.experimental_branch
+        return self._trials_by_id.get(trial_id)
 
     def _calculate_confidence(self, trial: Trial) -> float:
         """
         Calculate statistical confidence in result.
 
-        Simplified - production would use proper statistical tests
-        (e.g., chi-square for conversion rates).
+        Two-proportion z-test on the branches' conversion rates (won out of
+        won + lost), or a permutation test when the samples are too small
+        for the normal approximation and numba is installed; cached on the
+        trial until its outcome counters change.
         """
-        # Simplified confidence based on sample size and difference
-        classic_n = trial.classic_branch.leads_qualified
-        exp_n = trial.experimental_branch.leads_qualified
+        classic = trial.classic_branch
+        experimental = trial.experimental_branch
+        key = (
+            classic.outcomes_won, classic.outcomes_lost,
+            experimental.outcomes_won, experimental.outcomes_lost,
+        )
 
-        # Larger samples = higher confidence
-        sample_confidence = min((classic_n + exp_n) / (trial.min_sample_size * 4), 1.0)
+        cached = trial._confidence_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        # Larger difference = higher confidence
-        fitness_diff = abs(
-            trial.classic_branch.fitness_score -
-            trial.experimental_branch.fitness_score
+        args = (
+            classic.outcomes_won, classic.outcomes_won + classic.outcomes_lost,
+            experimental.outcomes_won, experimental.outcomes_won + experimental.outcomes_lost,
         )
-        difference_confidence = min(fitness_diff / 0.2, 1.0)  # 20% difference = full confidence
-
-        return (sample_confidence + difference_confidence) / 2
+        if NUMBA_AVAILABLE and _needs_exact_test(*args):
+            confidence = _permutation_confidence(*args)
+        else:
+            confidence = _two_proportion_confidence(*args)
+        trial._confidence_cache = (key, confidence)
+        return confidence
 
     def _get_current_standard(self) -> Dict[str, Any]:
         """Get current standard configuration"""
         standards_file = self.storage_dir / 'current_standard.json'
-        if standards_file.exists():
-            with open(standards_file, 'r') as f:
-                return json.load(f)
+        try:
+            mtime_ns = os.stat(standards_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            # Re-parse only when the file has changed since the last read
+            if self._std_cache is None or self._std_cache[0] != mtime_ns:
+                with open(standards_file, 'r') as f:
+                    self._std_cache = (mtime_ns, json.load(f))
+            return copy.deepcopy(self._std_cache[1])
 
         # Default standard
         return {
@@ -556,12 +1031,63 @@ class TrialManager:
         standards_file = self.storage_dir / 'current_standard.json'
         with open(standards_file, 'w') as f:
             json.dump(config, f, indent=2)
+        self._std_cache = None
+
+    def flush(self):
+        """Push buffered event-log lines to disk"""
+        for trial_id in list(self._logs):
+            with self._trial_locks[trial_id]:
+                fp = self._logs.get(trial_id)
+                if fp is not None:
+                    fp.flush()
+
+    def close(self):
+        """Snapshot every trial with logged events and close the logs"""
+        for trial_id in list(self._unsnapshotted):
+            trial = self._get_trial(trial_id)
+            if trial:
+                self._save_trial(trial)
+        for fp in self._logs.values():
+            fp.close()
+        self._logs.clear()
+        _live_managers.discard(self)
+
+    def __del__(self):
+        # Collected before exit: snapshot and close as the exit hook would
+        if getattr(self, '_logs', None) or getattr(self, '_unsnapshotted', None):
+            try:
+                self.close()
+            except OSError as e:
+                logger.warning(f"Could not snapshot trials in {self.storage_dir}: {e}")
+
+    def snapshot(self, trial_id: str, pretty: bool = False):
+        """Write the full trial JSON now (indented if pretty, for export)"""
+        trial = self._get_trial(trial_id)
+        if trial:
+            self._save_trial(trial, pretty=pretty)
+
+    def _save_trial(self, trial: Trial, pretty: bool = False):
+        """
+        Snapshot the full trial JSON and drop its event log, whose events
+        the snapshot now includes.
 
-    def _save_trial(self, trial: Trial):
-        """Save trial to storage"""
-        filepath = self.storage_dir / f"{trial.trial_id}.json"
-        with open(filepath, 'w') as f:
-            json.dump(trial.to_dict(), f, indent=2)
+        The snapshot carries the last logged sequence number, so a log
+        left behind by a crash before the unlink is not counted twice.
+        """
+        trial_id = trial.trial_id
+        with self._trial_locks[trial_id]:
+            data = trial.to_dict()
+            data['log_seq'] = self._log_seq.get(trial_id, 0)
+            _dump_json_atomic(self.storage_dir / f"{trial_id}.json", data, pretty)
+
+            self._unsnapshotted.pop(trial_id, None)
+            fp = self._logs.pop(trial_id, None)
+            if fp is not None:
+                fp.close()
+            try:
+                os.remove(self.storage_dir / f"{trial_id}.log")
+            except FileNotFoundError:
+                pass
 
     def _save_result(self, result: TrialResult):
         """Save trial result"""
@@ -569,23 +1095,84 @@ class TrialManager:
         results_dir.mkdir(exist_ok=True)
 
         filepath = results_dir / f"{result.trial_id}_result.json"
-        with open(filepath, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(result.to_dict()))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(result.to_dict(), f, **_COMPACT)
 
     def _load_trials(self):
         """Load existing trials from storage"""
         if not self.storage_dir.exists():
             return
 
-        for filepath in self.storage_dir.glob('trial_*.json'):
+        with os.scandir(self.storage_dir) as it:
+            paths = sorted(
+                entry.path for entry in it
+                if entry.name.startswith('trial_') and entry.name.endswith('.json')
+            )
+
+        # Reading and parsing are independent per file; large histories can
+        # opt in to doing them on a thread pool
+        if os.environ.get('ROSE_GLASS_PARALLEL_LOAD') == '1' and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=_PARALLEL_LOAD_WORKERS) as ex:
+                loaded = list(ex.map(self._read_trial_file, paths))
+        else:
+            loaded = map(self._read_trial_file, paths)
+
+        for filepath, (trial, log_seq, error) in zip(paths, loaded):
+            if error is not None:
+                logger.warning(f"Failed to load {filepath}: {error}")
+                continue
+
+            # Replay events logged since the last snapshot
+            replayed, log_seq = self._replay_log(trial, log_seq)
+            self._log_seq[trial.trial_id] = log_seq
+            if replayed:
+                self._unsnapshotted[trial.trial_id] = replayed
+
+            self._register_trial(trial)
+            logger.info(f"  Found trial: {trial.name}")
+
+    @staticmethod
+    def _read_trial_file(path: str) -> tuple:
+        """(Trial, log_seq, None) parsed from a snapshot file, or (None, 0, error)"""
+        try:
+            data = _read_json(path)
+            return Trial.from_dict(data), data.get('log_seq', 0), None
+        except Exception as e:
+            return None, 0, e
+
+    def _replay_log(self, trial: Trial, log_seq: int) -> tuple:
+        """
+        Apply the trial's logged events numbered after log_seq (the
+        snapshot's) to its counters. Returns (events applied, last sequence
+        number seen).
+        """
+        log_path = self.storage_dir / f"{trial.trial_id}.log"
+        try:
+            with open(log_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return 0, log_seq
+
+        replayed = 0
+        for line in lines:
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    # Reconstruct trial object (simplified - production would be more robust)
-                    # For now, just log that trials exist
-                    logger.info(f"  Found trial: {data.get('name')}")
-            except Exception as e:
-                logger.warning(f"Failed to load {filepath}: {e}")
+                event = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except ValueError:
+                # Torn final line from an interrupted write
+                logger.warning(f"Skipping unreadable event in {log_path}")
+                continue
+            seq = event.get('s')
+            if seq is not None:
+                if seq <= log_seq:
+                    continue  # Already in the snapshot
+                log_seq = seq
+            self._apply_event(trial, event)
+            replayed += 1
+        return replayed, log_seq
 
 
 # Example usage
@@ -618,21 +1205,31 @@ if __name__ == "__main__":
 
     # Simulate qualifications
     print("\n📊 Simulating lead qualifications...")
-    for i in range(60):
-        branch = trial.assign_branch()
-        tier = random.choices(
-            ['hot', 'warm', 'cold', 'disqualified'],
-            weights=[0.15, 0.35, 0.30, 0.20]
-        )[0]
-        manager.record_qualification(trial.trial_id, branch, tier)
+    tier_names = ['hot', 'warm', 'cold', 'disqualified']
+    tier_weights = [0.15, 0.35, 0.30, 0.20]
+    branches = manager.assign_bulk(trial, 60)
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng()
+        tiers = rng.choice(tier_names, size=60, p=tier_weights).tolist()
+    else:
+        tiers = random.choices(tier_names, weights=tier_weights, k=60)
+    manager.record_qualifications_bulk(trial.trial_id, branches, tiers)
 
     # Simulate outcomes
     print("📊 Simulating outcomes...")
-    for i in range(30):
-        branch = 'classic' if i < 15 else 'experimental'
-        outcome = random.choices(['won', 'lost'], weights=[0.3, 0.7])[0]
-        deal_value = random.randint(20000, 80000) if outcome == 'won' else 0
-        manager.record_outcome(trial.trial_id, branch, outcome, deal_value, cost=5000)
+    outcome_branches = ['classic'] * 15 + ['experimental'] * 15
+    if NUMPY_AVAILABLE:
+        outcomes = rng.choice(['won', 'lost'], size=30, p=[0.3, 0.7])
+        deal_values = np.where(
+            outcomes == 'won', rng.integers(20000, 80000, size=30, endpoint=True), 0
+        ).tolist()
+        outcomes = outcomes.tolist()
+    else:
+        outcomes = random.choices(['won', 'lost'], weights=[0.3, 0.7], k=30)
+        deal_values = [random.randint(20000, 80000) if o == 'won' else 0 for o in outcomes]
+    manager.record_outcomes_bulk(
+        trial.trial_id, outcome_branches, outcomes, deal_values, costs=[5000] * 30
+    )
 
     # Evaluate trial
     print("\n" + "=" * 60)
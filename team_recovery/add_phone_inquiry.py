@@ -9,23 +9,332 @@ and get immediate Rose Glass qualification.
 
 import sys
 from pathlib import Path
+import atexit
 import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from hunter.data_hunter import DataHunter
-from pipeline.qualifier import LeadQualifier
+
+PENDING_FILE = (
+    Path(__file__).resolve().parent.parent / 'data' / 'leads' / 'pending_admissions.jsonl'
+)
+PENDING_DB = PENDING_FILE.with_suffix('.db')
+
+_dir_ready = False
+
+
+def _ensure_dir():
+    """Create PENDING_FILE's directory (once per process)"""
+    global _dir_ready
+    if not _dir_ready:
+        PENDING_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
+
+
+# Menu options as (stored value, label shown to the operator), numbered from 1
+_SOURCE_OPTIONS = (
+    ('self_referral', 'Self (individual called)'),
+    ('family_referral', 'Family member'),
+    ('therapist_referral', 'Therapist/Provider'),
+    ('court_ordered', 'Court/Legal system'),
+    ('er_referral', 'ER/Hospital'),
+    ('friend_referral', 'Friend/Peer'),
+    ('employer_referral', 'Employer/EAP'),
+    ('unknown', 'Other'),
+)
+
+_INSURANCE_OPTIONS = (
+    ('private_insurance', 'Private insurance'),
+    ('medicaid', 'Medicaid'),
+    ('medicare', 'Medicare'),
+    ('tricare', 'Tricare (military)'),
+    ('self_pay', 'Self-pay'),
+    ('uninsured', 'No insurance/unsure'),
+)
+
+_TIMELINE_OPTIONS = (
+    ('immediate', 'Immediately (today/tomorrow)'),
+    ('this_week', 'This week'),
+    ('this_month', 'This month'),
+    ('next_month', 'Next month'),
+    ('exploring', 'Just exploring options'),
+)
+
+
+def _choice_map(options) -> MappingProxyType:
+    """Read-only {'1': value, '2': value, ...} for a menu"""
+    return MappingProxyType({str(i): value for i, (value, _) in enumerate(options, 1)})
+
+
+def _menu_str(labels) -> str:
+    """Numbered menu block, one '  N. label' line per option"""
+    return "\n".join(f"  {i}. {label}" for i, label in enumerate(labels, 1))
+
+
+SOURCE_MENU = tuple(label for _, label in _SOURCE_OPTIONS)
+SOURCE_MAP = _choice_map(_SOURCE_OPTIONS)
+
+INSURANCE_MENU = tuple(label for _, label in _INSURANCE_OPTIONS)
+INSURANCE_MAP = _choice_map(_INSURANCE_OPTIONS)
+
+TIMELINE_MENU = tuple(label for _, label in _TIMELINE_OPTIONS)
+TIMELINE_MAP = _choice_map(_TIMELINE_OPTIONS)
+
+# Rendered once at import
+SOURCE_MENU_STR = _menu_str(SOURCE_MENU)
+INSURANCE_MENU_STR = _menu_str(INSURANCE_MENU)
+TIMELINE_MENU_STR = _menu_str(TIMELINE_MENU)
+
+
+def _yn(prompt: str) -> bool:
+    """Ask a yes/no question; any answer starting with y/Y is yes"""
+    return input(prompt).strip()[:1].lower() == 'y'
+
+
+def _emit(lines):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Cached per process: repeated inquiries (batch import, replays) reuse one
+# instance. Call .cache_clear() where a fresh one is needed, e.g. in tests.
+# The qualifier is shared the same way through pipeline.get_qualifier.
+#
+# Imports are deferred to first use so the prompts come up before the
+# hunter/qualifier import graph is loaded.
+@lru_cache(maxsize=None)
+def _hunter():
+    from hunter.data_hunter import DataHunter
+    return DataHunter()
+
+
+def _qualifier(lens: str, branch: str):
+    from pipeline.qualifier import get_qualifier
+    return get_qualifier(lens, branch)
+
+
+def _start_warmup():
+    """
+    Build the hunter and qualifier on a background thread while the
+    operator is still typing. Returns (hunter future, qualifier future).
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='warmup')
+    futures = (
+        executor.submit(_hunter),
+        executor.submit(_qualifier, 'team_recovery_draper', 'classic'),
+    )
+    executor.shutdown(wait=False)
+    return futures
+
+
+def _json_pretty(obj) -> str:
+    """Indented JSON for display"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _json_load_file(path: Path):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _jsonl_line(obj) -> bytes:
+    """One compact JSON-Lines record, keys sorted so records diff cleanly"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS) + b'\n'
+    return json.dumps(obj, separators=(',', ':'), sort_keys=True).encode() + b'\n'
+
+
+class AsyncArtifactWriter:
+    """
+    Appends records to a file from a background thread.
+
+    write() only enqueues, so the caller never waits on disk I/O.
+    flush() blocks until everything queued has been written; it is
+    registered with atexit so pending records drain on exit.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"writer-{path.name}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def write(self, data: bytes):
+        self._queue.put(data)
+
+    def flush(self):
+        self._queue.join()
+
+    def _run(self):
+        with open(self.path, 'ab') as f:
+            while True:
+                data = self._queue.get()
+                try:
+                    f.write(data)
+                    # One flush per burst of queued records
+                    if self._queue.empty():
+                        f.flush()
+                except OSError as e:
+                    print(f"\n❌ Failed to write {self.path}: {e}", file=sys.stderr)
+                finally:
+                    self._queue.task_done()
+
+
+_pending_writer = None
+
+
+def _get_pending_writer(path: Path) -> AsyncArtifactWriter:
+    global _pending_writer
+    if _pending_writer is None:
+        _pending_writer = AsyncArtifactWriter(path)
+    return _pending_writer
+
+
+def migrate_pending_json(json_path: Path, jsonl_path: Path) -> int:
+    """
+    One-shot conversion of the legacy pending_admissions.json array to
+    JSON Lines. Legacy entries go ahead of any already in the .jsonl
+    file, and the old file is kept as .json.migrated. Returns the
+    number of entries converted.
+    """
+    if not json_path.exists():
+        return 0
+
+    legacy = _json_load_file(json_path)
+
+    existing = jsonl_path.read_bytes() if jsonl_path.exists() else b''
+    tmp_path = jsonl_path.with_name(jsonl_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(b''.join(_jsonl_line(entry) for entry in legacy))
+        f.write(existing)
+    os.replace(tmp_path, jsonl_path)
+    json_path.rename(json_path.with_name(json_path.name + '.migrated'))
+
+    return len(legacy)
+
+
+def load_pending(pending_file: Optional[Path] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream pending admissions one record at a time, oldest first.
+
+    Includes entries still in a not-yet-migrated pending_admissions.json.
+    """
+    if pending_file is None:
+        pending_file = PENDING_FILE
+
+    # Records queued by this process must reach the file first
+    if _pending_writer is not None:
+        _pending_writer.flush()
+
+    legacy_file = pending_file.with_suffix('.json')
+    if legacy_file.exists():
+        yield from _json_load_file(legacy_file)
+
+    if not pending_file.exists():
+        return
+
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(pending_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def format_entered_at(entry: Dict[str, Any]) -> Optional[str]:
+    """
+    ISO timestamp (local time) for a pending admissions entry.
+
+    Entries store integer entered_at_ns; older ones an ISO entered_at string.
+    """
+    entered_at_ns = entry.get('entered_at_ns')
+    if entered_at_ns is None:
+        return entry.get('entered_at')
+    return datetime.fromtimestamp(entered_at_ns / 1e9).isoformat()
+
+
+_PENDING_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    lead_id TEXT PRIMARY KEY,
+    payload JSON NOT NULL,
+    entered_at_ns INTEGER,
+    tier TEXT
+)
+"""
+
+_db = None
+
+
+def pending_db() -> sqlite3.Connection:
+    """
+    The pending admissions database (WAL mode), opened once per process.
+
+    This is the synchronous, crash-safe record of pending leads, one row
+    per lead_id; the .jsonl file remains as an append-only export. A new
+    database is seeded from the existing JSON/JSONL history.
+    """
+    global _db
+    if _db is None:
+        _ensure_dir()
+        is_new = not PENDING_DB.exists()
+
+        conn = sqlite3.connect(PENDING_DB, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_PENDING_SCHEMA)
+        if is_new:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO leads VALUES (?, ?, ?, ?)",
+                    (_lead_row(entry) for entry in load_pending()),
+                )
+        _db = conn
+    return _db
+
+
+def _lead_row(entry: Dict[str, Any]) -> tuple:
+    """leads table row for a pending admissions entry"""
+    entered_at_ns = entry.get('entered_at_ns')
+    if entered_at_ns is None and entry.get('entered_at'):
+        entered_at_ns = int(datetime.fromisoformat(entry['entered_at']).timestamp() * 1e9)
+    tier = (entry.get('qualification') or {}).get('qualification_tier')
+    return (entry['lead_id'], _jsonl_line(entry)[:-1].decode(), entered_at_ns, tier)
 
 
 def add_phone_inquiry():
     """Interactive lead entry for phone inquiries"""
 
-    print("\n" + "=" * 70)
-    print("  TEAM RECOVERY - PHONE INQUIRY ENTRY")
-    print("  Draper, Utah")
-    print("=" * 70)
+    _emit([
+        "\n" + "=" * 70,
+        "  TEAM RECOVERY - PHONE INQUIRY ENTRY",
+        "  Draper, Utah",
+        "=" * 70,
+    ])
+
+    hunter_future, qualifier_future = _start_warmup()
 
     # Collect information
     print("\n--- CONTACT INFORMATION ---")
@@ -37,28 +346,10 @@ def add_phone_inquiry():
     phone = input("Phone: ").strip()
     email = input("Email (optional): ").strip() or None
 
-    print("\n--- REFERRAL SOURCE ---")
-    print("  1. Self (individual called)")
-    print("  2. Family member")
-    print("  3. Therapist/Provider")
-    print("  4. Court/Legal system")
-    print("  5. ER/Hospital")
-    print("  6. Friend/Peer")
-    print("  7. Employer/EAP")
-    print("  8. Other")
-
-    source_map = {
-        '1': 'self_referral',
-        '2': 'family_referral',
-        '3': 'therapist_referral',
-        '4': 'court_ordered',
-        '5': 'er_referral',
-        '6': 'friend_referral',
-        '7': 'employer_referral',
-        '8': 'unknown',
-    }
-    source_choice = input("Select (1-8): ").strip()
-    source = source_map.get(source_choice, 'unknown')
+    _emit(["\n--- REFERRAL SOURCE ---", SOURCE_MENU_STR])
+
+    source_choice = input(f"Select (1-{len(SOURCE_MENU)}): ").strip()
+    source = SOURCE_MAP.get(source_choice, 'unknown')
 
     # Substance information
     print("\n--- CLINICAL INFORMATION ---")
@@ -69,27 +360,13 @@ def add_phone_inquiry():
     if secondary:
         substances.append(secondary)
 
-    previous_treatment = input("Previous treatment? (y/n): ").strip().lower() == 'y'
+    previous_treatment = _yn("Previous treatment? (y/n): ")
 
     # Insurance/resources
-    print("\n--- INSURANCE & RESOURCES ---")
-    print("  1. Private insurance")
-    print("  2. Medicaid")
-    print("  3. Medicare")
-    print("  4. Tricare (military)")
-    print("  5. Self-pay")
-    print("  6. No insurance/unsure")
-
-    insurance_map = {
-        '1': 'private_insurance',
-        '2': 'medicaid',
-        '3': 'medicare',
-        '4': 'tricare',
-        '5': 'self_pay',
-        '6': 'uninsured',
-    }
-    insurance_choice = input("Select (1-6): ").strip()
-    insurance_type = insurance_map.get(insurance_choice, 'uninsured')
+    _emit(["\n--- INSURANCE & RESOURCES ---", INSURANCE_MENU_STR])
+
+    insurance_choice = input(f"Select (1-{len(INSURANCE_MENU)}): ").strip()
+    insurance_type = INSURANCE_MAP.get(insurance_choice, 'uninsured')
 
     if insurance_choice in ['1', '2', '3', '4']:
         insurance_provider = input("  Provider name: ").strip()
@@ -97,36 +374,23 @@ def add_phone_inquiry():
         insurance_provider = insurance_type
 
     # Urgency assessment
-    print("\n--- URGENCY ASSESSMENT ---")
-    print("⚠️  CRISIS INDICATORS:")
-    crisis_check = input("Any suicide risk, overdose, severe withdrawal? (y/n): ").strip().lower()
-
-    if crisis_check == 'y':
-        print("\n🚨 CRISIS PROTOCOL:")
-        print("  1. IMMEDIATE clinical assessment required")
-        print("  2. Contact crisis clinician NOW")
-        print("  3. National Suicide Prevention: 988")
-        print("  4. If medical emergency: 911")
+    _emit(["\n--- URGENCY ASSESSMENT ---", "⚠️  CRISIS INDICATORS:"])
+    if _yn("Any suicide risk, overdose, severe withdrawal? (y/n): "):
+        _emit([
+            "\n🚨 CRISIS PROTOCOL:",
+            "  1. IMMEDIATE clinical assessment required",
+            "  2. Contact crisis clinician NOW",
+            "  3. National Suicide Prevention: 988",
+            "  4. If medical emergency: 911",
+        ])
         timeline = 'immediate'
         crisis_flag = True
     else:
         crisis_flag = False
-        print("\nWhen are they looking to start?")
-        print("  1. Immediately (today/tomorrow)")
-        print("  2. This week")
-        print("  3. This month")
-        print("  4. Next month")
-        print("  5. Just exploring options")
-
-        timeline_map = {
-            '1': 'immediate',
-            '2': 'this_week',
-            '3': 'this_month',
-            '4': 'next_month',
-            '5': 'exploring',
-        }
-        timeline_choice = input("Select (1-5): ").strip()
-        timeline = timeline_map.get(timeline_choice, 'exploring')
+        _emit(["\nWhen are they looking to start?", TIMELINE_MENU_STR])
+
+        timeline_choice = input(f"Select (1-{len(TIMELINE_MENU)}): ").strip()
+        timeline = TIMELINE_MAP.get(timeline_choice, 'exploring')
 
     # Additional notes
     print("\n--- ADDITIONAL NOTES ---")
@@ -135,7 +399,15 @@ def add_phone_inquiry():
     # Create lead
     print("\n🔍 Analyzing lead through Rose Glass...")
 
-    hunter = DataHunter()
+    try:
+        hunter = hunter_future.result()
+    except ImportError as e:
+        _emit([
+            f"\n❌ Could not load the Rose Glass pipeline: {e}",
+            "   Install dependencies with: pip install -r requirements.txt",
+        ])
+        return
+
     lead = hunter.create_manual_lead(
         company_name=name,  # For individuals, use name as identifier
         contact_name=name,
@@ -159,75 +431,75 @@ def add_phone_inquiry():
         'insurance_provider': insurance_provider,
         'crisis_flag': crisis_flag,
     }
-    lead.notes += f"\n\nRecovery Data: {json.dumps(recovery_data, indent=2)}"
+    lead.notes += f"\n\nRecovery Data: {_json_pretty(recovery_data)}"
 
     # Qualify through Team Recovery lens
     try:
-        qualifier = LeadQualifier(lens_name='team_recovery_draper', trial_branch='classic')
+        qualifier = qualifier_future.result()
         result = qualifier.qualify(lead)
     except Exception as e:
-        print(f"\n❌ Error during qualification: {e}")
-        print("Defaulting to manual triage")
+        _emit([f"\n❌ Error during qualification: {e}", "Defaulting to manual triage"])
         return
 
+    # Serialized once; reused by everything that stores the result
+    qual_dict = result.to_dict()
+
     # Display result
-    print("\n" + "=" * 70)
-    print("  ROSE GLASS QUALIFICATION RESULT")
-    print("=" * 70)
+    coherence = result.coherence
+    out = [
+        "\n" + "=" * 70,
+        "  ROSE GLASS QUALIFICATION RESULT",
+        "=" * 70,
+    ]
 
     # Crisis alert
-    if result.coherence.q_urgency > 0.7 or crisis_flag:
-        print("\n🚨 🚨 🚨 CRISIS ALERT 🚨 🚨 🚨")
-        print("\n  IMMEDIATE ACTION REQUIRED:")
-        print("  1. Contact crisis clinician NOW")
-        print("  2. Clinical assessment within 2 hours")
-        print("  3. Document all interventions")
-        print("  4. Suicide Prevention Lifeline: 988")
-        print("\n" + "=" * 70)
+    if coherence.q_urgency > 0.7 or crisis_flag:
+        out += [
+            "\n🚨 🚨 🚨 CRISIS ALERT 🚨 🚨 🚨",
+            "\n  IMMEDIATE ACTION REQUIRED:",
+            "  1. Contact crisis clinician NOW",
+            "  2. Clinical assessment within 2 hours",
+            "  3. Document all interventions",
+            "  4. Suicide Prevention Lifeline: 988",
+            "\n" + "=" * 70,
+        ]
 
     # Qualification details
-    print(f"\nLead: {name}")
-    print(f"Tier: {result.qualification_tier.upper()}")
-    print(f"Coherence Score: {result.coherence.coherence_score:.2f} / 4.0")
-    print(f"Priority: {result.priority_score:.2f}")
-
-    print(f"\nDimensions:")
-    print(f"  Ψ (Readiness):  {result.coherence.psi_intent:.2f}")
-    print(f"  ρ (Resources):  {result.coherence.rho_authority:.2f}")
-    print(f"  q (Urgency):    {result.coherence.q_urgency:.2f}")
-    print(f"  f (Program Fit): {result.coherence.f_fit:.2f}")
-
-    if result.coherence.positive_signals:
-        print(f"\n✓ Positive Signals:")
-        for signal in result.coherence.positive_signals:
-            print(f"  • {signal}")
-
-    if result.coherence.warning_signals:
-        print(f"\n⚠️  Warnings:")
-        for warning in result.coherence.warning_signals:
-            print(f"  • {warning}")
-
-    print(f"\n📋 Next Actions:")
-    for action in result.coherence.next_actions:
-        print(f"  • {action}")
-
-    print(f"\nNext Stage: {result.next_stage}")
+    out += [
+        f"\nLead: {name}",
+        f"Tier: {result.qualification_tier.upper()}",
+        f"Coherence Score: {coherence.coherence_score:.2f} / 4.0",
+        f"Priority: {result.priority_score:.2f}",
+        "\nDimensions:",
+        f"  Ψ (Readiness):  {coherence.psi_intent:.2f}",
+        f"  ρ (Resources):  {coherence.rho_authority:.2f}",
+        f"  q (Urgency):    {coherence.q_urgency:.2f}",
+        f"  f (Program Fit): {coherence.f_fit:.2f}",
+    ]
+
+    if coherence.positive_signals:
+        out.append("\n✓ Positive Signals:")
+        out += [f"  • {signal}" for signal in coherence.positive_signals]
+
+    if coherence.warning_signals:
+        out.append("\n⚠️  Warnings:")
+        out += [f"  • {warning}" for warning in coherence.warning_signals]
+
+    out.append("\n📋 Next Actions:")
+    out += [f"  • {action}" for action in coherence.next_actions]
+
+    out += [f"\nNext Stage: {result.next_stage}", "\n" + "=" * 70]
+    _emit(out)
 
     # Save option
-    print("\n" + "=" * 70)
-    save = input("\nSave lead to pending admissions? (y/n): ").strip().lower()
-
-    if save == 'y':
-        # Save to pending admissions file
-        pending_file = Path(__file__).parent.parent / 'data' / 'leads' / 'pending_admissions.json'
-        pending_file.parent.mkdir(parents=True, exist_ok=True)
+    if _yn("\nSave lead to pending admissions? (y/n): "):
+        # Save to pending admissions file (one JSON record per line)
+        pending_file = PENDING_FILE
+        _ensure_dir()
 
-        # Load existing
-        if pending_file.exists():
-            with open(pending_file) as f:
-                pending = json.load(f)
-        else:
-            pending = []
+        migrated = migrate_pending_json(pending_file.with_suffix('.json'), pending_file)
+        if migrated:
+            print(f"  (Converted {migrated} leads from pending_admissions.json)")
 
         # Add new lead
         lead_entry = {
@@ -242,40 +514,49 @@ def add_phone_inquiry():
             'timeline': timeline,
             'crisis_flag': crisis_flag,
             'notes': notes,
-            'qualification': result.to_dict(),
-            'entered_at': datetime.now().isoformat(),
+            'qualification': qual_dict,
+            'entered_at_ns': time.time_ns(),
             'entered_by': 'admissions',
         }
 
-        pending.append(lead_entry)
+        # Durable record first, then the JSONL export in the background
+        # (drained before the script exits)
+        db = pending_db()
+        with db:
+            db.execute("INSERT OR REPLACE INTO leads VALUES (?, ?, ?, ?)", _lead_row(lead_entry))
+        _get_pending_writer(pending_file).write(_jsonl_line(lead_entry))
 
-        # Save
-        with open(pending_file, 'w') as f:
-            json.dump(pending, f, indent=2)
-
-        print(f"\n✓ Lead saved!")
-        print(f"  Lead ID: {lead.lead_id}")
-        print(f"  Tier: {result.qualification_tier.upper()}")
-        print(f"  File: {pending_file}")
+        out = [
+            "\n✓ Lead saved!",
+            f"  Lead ID: {lead.lead_id}",
+            f"  Tier: {result.qualification_tier.upper()}",
+            f"  File: {pending_file}",
+        ]
 
         # Create follow-up reminder
         if result.qualification_tier == 'hot':
-            print(f"\n⏰ FOLLOW-UP REMINDER:")
-            print(f"  • Verify insurance within 4 hours")
-            print(f"  • Schedule clinical assessment within 24 hours")
-            print(f"  • Goal: Admission within 48 hours")
+            out += [
+                "\n⏰ FOLLOW-UP REMINDER:",
+                "  • Verify insurance within 4 hours",
+                "  • Schedule clinical assessment within 24 hours",
+                "  • Goal: Admission within 48 hours",
+            ]
         elif result.qualification_tier == 'warm':
-            print(f"\n⏰ FOLLOW-UP REMINDER:")
-            print(f"  • Send insurance verification inquiry")
-            print(f"  • Follow-up call in 3 business days")
+            out += [
+                "\n⏰ FOLLOW-UP REMINDER:",
+                "  • Send insurance verification inquiry",
+                "  • Follow-up call in 3 business days",
+            ]
+        _emit(out)
 
     else:
         print("\n Lead not saved")
 
-    print("\n" + "=" * 70)
-    print("  Thank you for using Rose Glass CRM")
-    print("=" * 70 + "\n")
-
+    _emit([
+        "\n" + "=" * 70,
+        "  Thank you for using Rose Glass CRM",
+        "=" * 70 + "\n",
+    ])
 
 if __name__ == "__main__":
     try:
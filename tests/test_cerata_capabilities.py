@@ -9,17 +9,56 @@ Run this after installing dependencies:
     playwright install
 """
 
+import importlib
+import importlib.util
+import os
 import sys
 from pathlib import Path
 import logging
 
-# Add parent directory to path
+# Add parent directory (and src, as pytest's pythonpath does) to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# (name, module, names imported from it, required)
+IMPORT_PROBES = (
+    ("Resilience tools", "capabilities.resilience_tools",
+     ("on_exception", "expo", "fibo", "constant", "circuit_breaker",
+      "CircuitBreaker", "CircuitState", "rate_limit", "TokenBucket"), True),
+    ("Capabilities package", "capabilities",
+     ("on_exception", "circuit_breaker", "rate_limit"), True),
+    ("AI Scraper", "hunter.ai_scraper",
+     ("AIScraper", "BusinessLead"), False),
+    ("Enhanced Web Hunter", "integrations.crawl4ai_hunter.enhanced_web_hunter",
+     ("EnhancedWebHunter", "HuntResult", "TREATMENT_CENTER_SCHEMA"), False),
+    ("Trial Manager", "trial.trial_manager",
+     ("TrialManager", "Trial", "TrialBranch"), True),
+    ("Crawl4AI Hunter Trial", "trials.crawl4ai_hunter_trial",
+     ("CrawlAIHunterTrial",), False),
+)
+
+
+def _probe(module_name, names):
+    """
+    Import names from a module as `from module import names` would.
+
+    Returns the exception raised (an ImportError, or whatever the module
+    raised while executing), or None on success.
+    """
+    try:
+        module = importlib.import_module(module_name)
+        for name in names:
+            if not hasattr(module, name):
+                raise ImportError(f"cannot import name '{name}' from '{module_name}'")
+    except Exception as e:
+        return e
+    return None
+
+
 def test_imports():
     """Test 1: Verify all new modules can be imported"""
     print("\n" + "=" * 70)
@@ -27,68 +66,15 @@ def test_imports():
     print("=" * 70)
 
     tests = []
-
-    # Test resilience tools
-    try:
-        from capabilities.resilience_tools import (
-            on_exception, expo, fibo, constant,
-            circuit_breaker, CircuitBreaker, CircuitState,
-            rate_limit, TokenBucket
-        )
-        print("✓ Resilience tools imported successfully")
-        tests.append(("Resilience tools", True))
-    except ImportError as e:
-        print(f"✗ Resilience tools import failed: {e}")
-        tests.append(("Resilience tools", False))
-
-    # Test capabilities package
-    try:
-        from capabilities import (
-            on_exception, circuit_breaker, rate_limit
-        )
-        print("✓ Capabilities package imported successfully")
-        tests.append(("Capabilities package", True))
-    except ImportError as e:
-        print(f"✗ Capabilities package import failed: {e}")
-        tests.append(("Capabilities package", False))
-
-    # Test AI scraper (may fail without dependencies)
-    try:
-        from src.hunter.ai_scraper import AIScraper, BusinessLead
-        print("✓ AI Scraper imported successfully")
-        tests.append(("AI Scraper", True))
-    except ImportError as e:
-        print(f"⚠  AI Scraper import failed (dependencies not installed): {e}")
-        tests.append(("AI Scraper", False))
-
-    # Test enhanced web hunter (may fail without dependencies)
-    try:
-        from integrations.crawl4ai_hunter.enhanced_web_hunter import (
-            EnhancedWebHunter, HuntResult, TREATMENT_CENTER_SCHEMA
-        )
-        print("✓ Enhanced Web Hunter imported successfully")
-        tests.append(("Enhanced Web Hunter", True))
-    except ImportError as e:
-        print(f"⚠  Enhanced Web Hunter import failed (dependencies not installed): {e}")
-        tests.append(("Enhanced Web Hunter", False))
-
-    # Test trial system
-    try:
-        from src.trial.trial_manager import TrialManager, Trial, TrialBranch
-        print("✓ Trial Manager imported successfully")
-        tests.append(("Trial Manager", True))
-    except ImportError as e:
-        print(f"✗ Trial Manager import failed: {e}")
-        tests.append(("Trial Manager", False))
-
-    # Test trial configuration
-    try:
-        from trials.crawl4ai_hunter_trial import CrawlAIHunterTrial
-        print("✓ Crawl4AI Hunter Trial imported successfully")
-        tests.append(("Crawl4AI Trial Config", True))
-    except ImportError as e:
-        print(f"⚠  Crawl4AI Trial Config import failed: {e}")
-        tests.append(("Crawl4AI Trial Config", False))
+    for display, module_name, names, required in IMPORT_PROBES:
+        error = _probe(module_name, names)
+        if error is None:
+            print(f"✓ {display} imported successfully")
+        elif required or not isinstance(error, ImportError):
+            print(f"✗ {display} import failed: {error!r}")
+        else:
+            print(f"⚠  {display} import failed (dependencies not installed): {error}")
+        tests.append((display, error is None))
 
     # Summary
     passed = sum(1 for _, success in tests if success)
@@ -107,7 +93,7 @@ def test_resilience_tools():
     try:
         from capabilities.resilience_tools import (
             on_exception, expo, circuit_breaker, CircuitBreaker,
-            CircuitState, rate_limit, TokenBucket
+            CircuitState, rate_limit, TokenBucket, fibo, wait_times_bulk
         )
 
         # Test exponential backoff generator
@@ -116,6 +102,13 @@ def test_resilience_tools():
         print(f"✓ Exponential backoff: {wait_times}")
         assert all(isinstance(w, (int, float)) for w in wait_times), "Invalid wait times"
 
+        # Test bulk wait times against the generators, past the 60s cap
+        for name, wait_gen in (('expo', expo), ('fibo', fibo)):
+            gen = wait_gen()
+            expected = [gen(i) for i in range(12)]
+            assert list(wait_times_bulk(12, name)) == expected, f"{name} bulk waits differ"
+        print("✓ Bulk wait times match expo and fibo")
+
         # Test circuit breaker
         breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=1)
         assert breaker.state == CircuitState.CLOSED, "Circuit should start closed"
@@ -159,7 +152,8 @@ def test_trial_system():
     print("=" * 70)
 
     try:
-        from src.trial.trial_manager import TrialManager, TrialStatus
+        import numpy as np
+        from trial.trial_manager import TrialManager, TrialStatus
 
         # Initialize manager
         manager = TrialManager()
@@ -181,9 +175,10 @@ def test_trial_system():
         print(f"✓ Trial started: {trial.status.value}")
 
         # Test branch assignment
-        assignments = [trial.assign_branch() for _ in range(20)]
-        classic_count = sum(1 for b in assignments if b == 'classic')
-        exp_count = sum(1 for b in assignments if b == 'experimental')
+        assignments = manager.assign_bulk(trial, 20)
+        assert len(assignments) == 20, "Every lead should get a branch"
+        exp_count = np.count_nonzero(assignments)
+        classic_count = len(assignments) - exp_count
         print(f"✓ Branch assignment: {classic_count} classic, {exp_count} experimental")
 
         # Record some test data
@@ -209,9 +204,10 @@ def test_trial_system():
         return True
 
     except Exception as e:
-        print(f"\n✗ Trial system test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Trial system test failed: {e!r}")
+        if os.environ.get("CERATA_TEST_VERBOSE"):
+            import traceback
+            traceback.print_exc()
         return False
 
 
@@ -257,7 +253,7 @@ def test_rose_glass_integration():
 
         # Test BusinessLead with intent signals
         try:
-            from src.hunter.ai_scraper import BusinessLead
+            from hunter.ai_scraper import BusinessLead
 
             lead = BusinessLead(
                 business_name="Test Recovery Center",
@@ -282,12 +278,24 @@ def test_rose_glass_integration():
         return True
 
     except Exception as e:
-        print(f"\n✗ Rose Glass integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Rose Glass integration test failed: {e!r}")
+        if os.environ.get("CERATA_TEST_VERBOSE"):
+            import traceback
+            traceback.print_exc()
         return False
 
 
+# (module, (marker, suffix) printed when it is missing)
+OPTIONAL_DEPENDENCIES = (
+    ("crawl4ai", ("✗", "")),
+    ("playwright", ("✗", "")),
+    ("pydantic", ("✗", "")),
+    ("backoff", ("✗", "")),
+    ("circuitbreaker", ("⚠ ", " (optional)")),
+    ("xgboost", ("⚠ ", " (for future ML scoring)")),
+)
+
+
 def test_optional_dependencies():
     """Test 5: Check optional dependencies and provide install instructions"""
     print("\n" + "=" * 70)
@@ -296,59 +304,15 @@ def test_optional_dependencies():
 
     dependencies = []
 
-    # Crawl4AI
-    try:
-        import crawl4ai
-        print("✓ crawl4ai installed")
-        dependencies.append(("crawl4ai", True))
-    except ImportError:
-        print("✗ crawl4ai not installed")
-        dependencies.append(("crawl4ai", False))
-
-    # Playwright
-    try:
-        import playwright
-        print("✓ playwright installed")
-        dependencies.append(("playwright", True))
-    except ImportError:
-        print("✗ playwright not installed")
-        dependencies.append(("playwright", False))
-
-    # Pydantic
-    try:
-        import pydantic
-        print("✓ pydantic installed")
-        dependencies.append(("pydantic", True))
-    except ImportError:
-        print("✗ pydantic not installed")
-        dependencies.append(("pydantic", False))
-
-    # Backoff
-    try:
-        import backoff
-        print("✓ backoff installed")
-        dependencies.append(("backoff", True))
-    except ImportError:
-        print("✗ backoff not installed")
-        dependencies.append(("backoff", False))
-
-    # CircuitBreaker
-    try:
-        import circuitbreaker
-        print("✓ circuitbreaker installed")
-        dependencies.append(("circuitbreaker", True))
-    except ImportError:
-        print("⚠  circuitbreaker not installed (optional)")
-        dependencies.append(("circuitbreaker", False))
-
-    # XGBoost
-    try:
-        import xgboost
-        print("✓ xgboost installed")
-        dependencies.append(("xgboost", True))
-    except ImportError:
-        print("⚠  xgboost not installed (for future ML scoring)")
-        dependencies.append(("xgboost", False))
+    # find_spec only consults the import finders, so heavy packages
+    # (crawl4ai, playwright) are located without running their __init__
+    for name, missing_note in OPTIONAL_DEPENDENCIES:
+        installed = importlib.util.find_spec(name) is not None
+        if installed:
+            print(f"✓ {name} installed")
+        else:
+            print(f"{missing_note[0]} {name} not installed{missing_note[1]}")
+        dependencies.append((name, installed))
 
     missing = [name for name, installed in dependencies if not installed]
 
@@ -0,0 +1,187 @@
+"""
+Crawl4AI Hunter Trial helpers
+=============================
+
+Adaptive concurrency and the classic branch's CSS extraction.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from trial.trial_manager import TrialManager
+from trials import crawl4ai_hunter_trial as hunter_trial
+from trials.crawl4ai_hunter_trial import ADAPT_EVERY, _AdaptiveLimiter
+
+MS = 1_000_000
+
+
+async def _run(limiter, outcomes, latency_ns=MS):
+    """Push one request per outcome (True = errored) through the limiter"""
+    for errored in outcomes:
+        await limiter.acquire()
+        limiter.release(latency_ns, errored)
+
+
+def test_limiter_grows_on_success():
+    limiter = _AdaptiveLimiter(4, max_limit=6)
+    asyncio.run(_run(limiter, [False] * (ADAPT_EVERY * 5)))
+    assert limiter.limit == 6  # +1 per healthy window, capped at max_limit
+
+
+def test_limiter_shrinks_on_errors():
+    limiter = _AdaptiveLimiter(8)
+    asyncio.run(_run(limiter, [True] * ADAPT_EVERY))
+    assert limiter.limit == 4
+    asyncio.run(_run(limiter, [True] * (ADAPT_EVERY * 4)))
+    assert limiter.limit == limiter.min_limit
+
+
+def test_limiter_caps_in_flight():
+    limiter = _AdaptiveLimiter(3)
+    in_flight = peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        await limiter.acquire()
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        limiter.release(MS, False)
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(20)))
+
+    asyncio.run(main())
+    assert peak == 3
+
+
+LISTING = """
+<html><body>
+  <h1>Treatment centers</h1>
+  <div class="listing"><h2>Hope House</h2><a href="/hope">More</a>
+    <span class="phone">555-0100</span></div>
+  <div class="listing"><h2>New Dawn</h2><a href="/dawn">More</a></div>
+  <div class="listing"><p>No fields here</p></div>
+</body></html>
+"""
+
+SCHEMA = {
+    'name': 'Listings',
+    'baseSelector': 'div.listing',
+    'fields': [
+        {'name': 'name', 'selector': 'h2', 'type': 'text'},
+        {'name': 'url', 'selector': 'a', 'type': 'attribute', 'attribute': 'href'},
+        {'name': 'phone', 'selector': '.phone', 'type': 'text'},
+    ],
+}
+
+
+@pytest.mark.skipif(not hunter_trial.BS4_AVAILABLE, reason="beautifulsoup4 not installed")
+def test_extract_css_records():
+    text, records = hunter_trial.extract_css(LISTING, hunter_trial.compile_schema(SCHEMA))
+
+    assert records == [
+        {'name': 'Hope House', 'url': '/hope', 'phone': '555-0100'},
+        {'name': 'New Dawn', 'url': '/dawn'},
+    ]
+    assert 'Treatment centers' in text
+
+
+def _trial_in(storage_dir):
+    trial = hunter_trial.CrawlAIHunterTrial()
+    trial.trial_manager = TrialManager(storage_dir)
+    trial.create_trial()
+    trial.trial.start()
+    return trial
+
+
+def test_failed_branch_cancels_its_other_hunts(tmp_path):
+    """An exception out of one hunt leaves no sibling hunt running"""
+    trial = _trial_in(tmp_path)
+    finished = []
+
+    async def hunt_one(url):
+        if url.endswith('/0'):
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.2)
+        finished.append(url)
+
+    async def main():
+        urls = [f"http://test/{i}" for i in range(5)]
+        with pytest.raises(RuntimeError):
+            await trial._run_branch('Test', 'classic', urls, SCHEMA, hunt_one, 0)
+        await asyncio.sleep(0.3)
+
+    asyncio.run(main())
+    assert finished == []
+    trial.trial_manager.close()
+
+
+def test_timed_out_branch_stops_its_hunts(tmp_path):
+    """An outer wait_for timeout stops the work itself; finished hunts are kept"""
+    trial = _trial_in(tmp_path)
+    finished = []
+
+    async def hunt_one(url):
+        fast = url.endswith(('/0', '/1'))
+        await asyncio.sleep(0.01 if fast else 0.5)
+        finished.append(url)
+        return hunter_trial.HuntResult(url, 1, "", [], 0.9, 0.9, 0.9, 0.9, 0.9, 0.0, True)
+
+    async def main():
+        urls = [f"http://test/{i}" for i in range(5)]
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                trial._run_branch('Test', 'classic', urls, SCHEMA, hunt_one, 0), timeout=0.2
+            )
+        await trial.aclose()
+        await asyncio.sleep(0.5)
+
+    asyncio.run(main())
+    assert sorted(finished) == ["http://test/0", "http://test/1"]
+    # The two that finished before the timeout still reached the trial
+    assert trial.trial.classic_branch.leads_hot == 2
+    trial.trial_manager.close()
+
+
+def test_shared_hunter_closes_after_last_user(monkeypatch):
+    """Trials share one hunter; one trial's close leaves the browser to the others"""
+    from integrations.crawl4ai_hunter import enhanced_web_hunter
+
+    launched = []
+
+    class FakeCrawler:
+        def __init__(self, config):
+            self.open = False
+
+        async def __aenter__(self):
+            self.open = True
+            launched.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            self.open = False
+
+    monkeypatch.setattr(enhanced_web_hunter, 'CRAWL4AI_AVAILABLE', True)
+    monkeypatch.setattr(enhanced_web_hunter, 'BrowserConfig', lambda **kwargs: None, raising=False)
+    monkeypatch.setattr(enhanced_web_hunter, 'AsyncWebCrawler', FakeCrawler, raising=False)
+    hunter = enhanced_web_hunter.EnhancedWebHunter()
+
+    async def main():
+        first = await hunter.start()
+        second = await hunter.start()
+        assert first is second and len(launched) == 1
+
+        await first.close()
+        assert launched[0].open  # still in use by the second trial
+        await second.close()
+        assert not launched[0].open
+
+    asyncio.run(main())
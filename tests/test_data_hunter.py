@@ -0,0 +1,53 @@
+"""
+Data Hunter field detection
+===========================
+
+Column auto-detection for CRM exports and canonical-schema sources.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hunter.data_hunter import DataHunter, FieldMapping
+
+
+def test_partial_canonical_columns_are_detected():
+    """A source with only some canonical names falls through to detection"""
+    columns = ['company_name', 'contact_email', 'name', 'title', 'sector', 'description']
+
+    mapping = DataHunter()._auto_detect_fields(columns)
+
+    assert mapping.company_name == 'company_name'
+    assert mapping.contact_email == 'contact_email'
+    assert mapping.contact_name == 'name'
+    assert mapping.contact_title == 'title'
+    assert mapping.industry == 'sector'
+    assert mapping.notes == 'description'
+    # Nothing may point at a column the source doesn't have
+    mapped = {v for k, v in vars(mapping).items() if k != 'source' and v is not None}
+    assert mapped <= set(columns)
+
+
+def test_full_canonical_columns_map_to_themselves():
+    """All canonical names present verbatim -> identity mapping, as a fresh copy"""
+    columns = [name for name in vars(FieldMapping()) if name != 'source']
+    hunter = DataHunter()
+
+    first = hunter._auto_detect_fields(columns)
+    assert all(getattr(first, name) == name for name in columns)
+
+    first.notes = 'comments'
+    assert hunter._auto_detect_fields(columns).notes == 'notes'
+
+
+def test_duplicate_rows_get_distinct_lead_ids():
+    """Identical rows in one batch are kept as separate leads"""
+    row = {'company_name': 'Acme Recovery', 'contact_email': 'intake@acme.test'}
+
+    leads = DataHunter().ingest_dict([dict(row), dict(row), dict(row)])
+
+    assert len(leads) == 3
+    assert len({lead.lead_id for lead in leads}) == 3
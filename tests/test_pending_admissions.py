@@ -0,0 +1,60 @@
+"""
+Pending Admissions storage
+==========================
+
+JSON Lines persistence for team_recovery phone inquiries.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from team_recovery.add_phone_inquiry import (
+    AsyncArtifactWriter,
+    load_pending,
+    migrate_pending_json,
+)
+
+ENTRIES = [
+    {'lead_id': 'a1', 'entered_at_ns': 1_700_000_000_000_000_000,
+     'qualification': {'qualification_tier': 'hot'}, 'notes': 'called twice'},
+    {'lead_id': 'b2', 'entered_at_ns': 1_700_000_060_000_000_000,
+     'qualification': {'qualification_tier': 'cold'}, 'notes': 'ünïcode ok'},
+]
+
+LEGACY = [
+    {'lead_id': 'old1', 'entered_at': '2024-01-02T03:04:05', 'notes': 'legacy'},
+    {'lead_id': 'old2', 'entered_at': '2024-01-03T03:04:05', 'notes': 'legacy'},
+]
+
+
+def test_jsonl_round_trip(tmp_path):
+    """Records written through the async writer load back unchanged, in order"""
+    pending_file = tmp_path / 'pending_admissions.jsonl'
+    writer = AsyncArtifactWriter(pending_file)
+    for entry in ENTRIES:
+        writer.write(json.dumps(entry).encode() + b'\n')
+    writer.flush()
+
+    assert list(load_pending(pending_file)) == ENTRIES
+
+
+def test_legacy_migration_is_idempotent(tmp_path):
+    """Migrating twice converts the legacy array once and keeps its order"""
+    pending_file = tmp_path / 'pending_admissions.jsonl'
+    legacy_file = pending_file.with_suffix('.json')
+    legacy_file.write_text(json.dumps(LEGACY))
+    pending_file.write_text(''.join(json.dumps(e) + '\n' for e in ENTRIES))
+
+    # Not yet migrated: the legacy entries are still read, ahead of the rest
+    assert list(load_pending(pending_file)) == LEGACY + ENTRIES
+
+    assert migrate_pending_json(legacy_file, pending_file) == len(LEGACY)
+    assert migrate_pending_json(legacy_file, pending_file) == 0
+
+    assert list(load_pending(pending_file)) == LEGACY + ENTRIES
+    assert not legacy_file.exists()
+    assert legacy_file.with_name(legacy_file.name + '.migrated').exists()
@@ -0,0 +1,242 @@
+"""
+Trial Manager recording
+=======================
+
+Counter bookkeeping for the per-call and bulk recorders, and its
+persistence through the event log and snapshots.
+"""
+
+import gc
+import shutil
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import numpy as np
+import pytest
+
+from trial import trial_manager
+from trial.trial_manager import TrialManager
+
+QUALIFICATIONS = [
+    ('classic', 'hot'), ('experimental', 'warm'), ('classic', 'cold'),
+    ('experimental', 'disqualified'), ('experimental', 'hot'), ('classic', 'hot'),
+    ('experimental', 'unknown_tier'),
+]
+
+OUTCOMES = [
+    ('classic', 'won', 1200.0, 100.0), ('experimental', 'lost', 0.0, 80.0),
+    ('experimental', 'won', 5000.0, 250.0), ('classic', 'lost', 0.0, 0.0),
+    ('experimental', 'won', 750.5, 10.0),
+]
+
+
+def _running_trial(storage_dir: Path):
+    manager = TrialManager(storage_dir)
+    trial = manager.create_trial(
+        name="Recording test",
+        description="Bulk vs per-call recording",
+        experimental_config={'approach': 'test'},
+    )
+    trial.start()
+    return manager, trial
+
+
+def _counters(trial):
+    return trial.classic_branch.counters_tuple(), trial.experimental_branch.counters_tuple()
+
+
+def test_bulk_recording_matches_per_call(tmp_path):
+    """record_*_bulk leaves the same counters as one record_* call per lead"""
+    single, single_trial = _running_trial(tmp_path / 'single')
+    bulk, bulk_trial = _running_trial(tmp_path / 'bulk')
+
+    for branch, tier in QUALIFICATIONS:
+        single.record_qualification(single_trial.trial_id, branch, tier)
+    for branch, outcome, value, cost in OUTCOMES:
+        single.record_outcome(single_trial.trial_id, branch, outcome, value, cost)
+
+    branches, tiers = zip(*QUALIFICATIONS)
+    bulk.record_qualifications_bulk(bulk_trial.trial_id, branches, tiers)
+    branches, outcomes, values, costs = zip(*OUTCOMES)
+    bulk.record_outcomes_bulk(bulk_trial.trial_id, branches, outcomes, values, costs)
+
+    assert _counters(bulk_trial) == _counters(single_trial)
+    assert bulk_trial.experimental_branch.leads_qualified == 4
+    assert bulk_trial.experimental_branch.total_revenue == 5750.5
+
+    single.close()
+    bulk.close()
+
+
+def test_bulk_recording_accepts_assign_bulk_flags(tmp_path):
+    """assign_bulk booleans and branch names count against the same branches"""
+    manager, trial = _running_trial(tmp_path)
+
+    flags = list(manager.assign_bulk(trial, 200))
+    manager.record_qualifications_bulk(trial.trial_id, flags, ['warm'] * len(flags))
+
+    experimental = sum(bool(f) for f in flags)
+    assert trial.experimental_branch.leads_warm == experimental
+    assert trial.classic_branch.leads_warm == len(flags) - experimental
+
+    manager.close()
+
+
+def test_bulk_recording_accepts_numpy_arrays(tmp_path):
+    """numpy inputs (e.g. alongside an assign_bulk mask) record like lists"""
+    lists, lists_trial = _running_trial(tmp_path / 'lists')
+    arrays, arrays_trial = _running_trial(tmp_path / 'arrays')
+
+    branches, tiers = zip(*QUALIFICATIONS)
+    lists.record_qualifications_bulk(lists_trial.trial_id, branches, tiers)
+    arrays.record_qualifications_bulk(
+        arrays_trial.trial_id, np.array(branches) == 'experimental', np.array(tiers)
+    )
+
+    branches, outcomes, values, costs = zip(*OUTCOMES)
+    lists.record_outcomes_bulk(lists_trial.trial_id, branches, outcomes, values, costs)
+    arrays.record_outcomes_bulk(
+        arrays_trial.trial_id, np.array(branches) == 'experimental',
+        np.array(outcomes), np.array(values), np.array(costs)
+    )
+
+    assert _counters(arrays_trial) == _counters(lists_trial)
+
+    # The logged events replay to the same counters
+    arrays.flush()
+    reloaded = TrialManager(tmp_path / 'arrays')
+    assert _counters(reloaded._get_trial(arrays_trial.trial_id)) == _counters(lists_trial)
+
+    reloaded.close()
+    lists.close()
+    arrays.close()
+
+
+def _record_all(manager, trial):
+    for branch, tier in QUALIFICATIONS:
+        manager.record_qualification(trial.trial_id, branch, tier)
+    for branch, outcome, value, cost in OUTCOMES:
+        manager.record_outcome(trial.trial_id, branch, outcome, value, cost)
+
+
+def test_event_log_replays_after_crash(tmp_path):
+    """Events only in the log (no closing snapshot) are replayed on load"""
+    manager, trial = _running_trial(tmp_path)
+    _record_all(manager, trial)
+    manager.flush()  # on disk, but never snapshotted
+
+    reloaded = TrialManager(tmp_path)
+    assert _counters(reloaded._get_trial(trial.trial_id)) == _counters(trial)
+
+    reloaded.close()
+    manager.close()
+
+
+def test_snapshot_then_stale_log_is_not_double_counted(tmp_path):
+    """A crash between writing the snapshot and removing the log replays nothing twice"""
+    manager, trial = _running_trial(tmp_path)
+    _record_all(manager, trial)
+    manager.flush()
+
+    log_path = tmp_path / f"{trial.trial_id}.log"
+    stale = tmp_path / 'stale.log'
+    shutil.copy(log_path, stale)
+    manager.snapshot(trial.trial_id)
+    assert not log_path.exists()
+    shutil.move(stale, log_path)  # as if the unlink never happened
+
+    # Events after the snapshot continue the sequence and are replayed
+    manager.record_qualification(trial.trial_id, 'classic', 'warm')
+    manager.flush()
+    expected = _counters(trial)
+
+    reloaded = TrialManager(tmp_path)
+    assert _counters(reloaded._get_trial(trial.trial_id)) == expected
+
+    reloaded.close()
+    manager.close()
+
+
+def test_periodic_snapshot_truncates_log(tmp_path, monkeypatch):
+    """Every _SNAPSHOT_EVERY events the trial is snapshotted and its log dropped"""
+    monkeypatch.setattr(trial_manager, '_SNAPSHOT_EVERY', 4)
+    manager, trial = _running_trial(tmp_path)
+    log_path = tmp_path / f"{trial.trial_id}.log"
+
+    for _ in range(4):
+        manager.record_qualification(trial.trial_id, 'classic', 'hot')
+    assert not log_path.exists()
+
+    manager.record_qualification(trial.trial_id, 'experimental', 'cold')
+    manager.flush()
+    assert log_path.exists()
+
+    reloaded = TrialManager(tmp_path)
+    reloaded_trial = reloaded._get_trial(trial.trial_id)
+    assert reloaded_trial.classic_branch.leads_hot == 4
+    assert reloaded_trial.experimental_branch.leads_cold == 1
+
+    reloaded.close()
+    manager.close()
+
+
+def test_torn_final_log_line_is_skipped(tmp_path):
+    """A half-written last event is ignored; the rest still replay"""
+    manager, trial = _running_trial(tmp_path)
+    _record_all(manager, trial)
+    manager.flush()
+    expected = _counters(trial)
+
+    with open(tmp_path / f"{trial.trial_id}.log", 'ab') as f:
+        f.write(b'{"t":"q","b":"c","ti')
+
+    reloaded = TrialManager(tmp_path)
+    assert _counters(reloaded._get_trial(trial.trial_id)) == expected
+
+    reloaded.close()
+    manager.close()
+
+
+def test_failed_log_write_leaves_counters_unchanged(tmp_path, monkeypatch):
+    """Events are only counted once they have been written to the log"""
+    manager, trial = _running_trial(tmp_path)
+    _record_all(manager, trial)
+    expected = _counters(trial)
+
+    def unserializable(event):
+        raise TypeError("not serializable")
+
+    with monkeypatch.context() as m:
+        m.setattr(trial_manager, '_json_line', unserializable)
+        with pytest.raises(TypeError):
+            manager.record_outcome(trial.trial_id, 'classic', 'won', 500.0, 5.0)
+    assert _counters(trial) == expected
+
+    # The sequence was not advanced, so later events still replay
+    manager.record_qualification(trial.trial_id, 'experimental', 'hot')
+    manager.flush()
+    expected = _counters(trial)
+
+    reloaded = TrialManager(tmp_path)
+    assert _counters(reloaded._get_trial(trial.trial_id)) == expected
+
+    reloaded.close()
+    manager.close()
+
+
+def test_collected_manager_snapshots_its_trials(tmp_path):
+    """A manager garbage-collected before exit still snapshots and drops its logs"""
+    manager, trial = _running_trial(tmp_path)
+    _record_all(manager, trial)
+    trial_id, expected = trial.trial_id, _counters(trial)
+
+    del manager, trial
+    gc.collect()
+    assert not (tmp_path / f"{trial_id}.log").exists()
+
+    reloaded = TrialManager(tmp_path)
+    assert _counters(reloaded._get_trial(trial_id)) == expected
+    reloaded.close()
@@ -2,7 +2,7 @@
 CERATA Trial: Crawl4AI Enhanced Hunter
 ========================================
 
-Compare Crawl4AI-powered async hunter vs classic requests-based hunter.
+Compare Crawl4AI-powered async hunter vs classic aiohttp + CSS hunter.
 
 Trial Metrics:
 - Speed: Pages crawled per minute
@@ -14,28 +14,340 @@ CERATA Evolution: "Test everything, promote winners"
 """
 
 import asyncio
-from pathlib import Path
-from typing import List, Dict, Any
+from importlib import metadata
+import json
+from collections import OrderedDict, deque
+from types import SimpleNamespace
+from typing import List, Dict, Any, Awaitable, Callable, Iterator, Optional, Sequence
 import logging
+import math
 import time
 from datetime import datetime
-
-# Trial Manager
-import sys
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
-from trial.trial_manager import TrialManager
+from functools import lru_cache
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401  (enables aiohttp's AsyncResolver)
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    import soupsieve as sv  # bs4's CSS selector engine
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Trial Manager, from the installed package (pip install -e .). Always
+# 'trial.trial_manager', never 'src.trial.trial_manager', so numba's on-disk
+# kernel cache sees a single module name
+try:
+    from trial.trial_manager import TrialManager
+except ImportError as e:
+    raise ImportError(
+        f"{e}. Install the package first: pip install -e . (from the repo root)"
+    ) from e
 
 # Hunters
-sys.path.append(str(Path(__file__).parent.parent))
 from integrations.crawl4ai_hunter.enhanced_web_hunter import (
     EnhancedWebHunter,
-    TREATMENT_CENTER_SCHEMA
+    HuntResult,
+    TREATMENT_CENTER_SCHEMA,
+    page_dimensions,
 )
-from src.hunter.ai_scraper import AIScraper
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# In-flight request caps per branch (the browser branch is far heavier)
+CLASSIC_MAX_CONCURRENT = 20
+EXPERIMENTAL_MAX_CONCURRENT = 5
+CLASSIC_TIMEOUT_SECONDS = 30
+
+# Wall-clock bounds: per experimental page, and per demo run (scaled by URL
+# count, with a floor that covers browser launch plus one slow page)
+HUNT_TIMEOUT_SECONDS = 15
+TRIAL_SECONDS_PER_URL = 2
+TRIAL_MIN_TIMEOUT_SECONDS = 60
+
+# Adaptive concurrency: re-evaluate the cap every ADAPT_EVERY requests over
+# the last ADAPT_WINDOW; grow while errors stay under ADAPT_GROW_ERROR_RATE
+# and p95 latency holds, halve once they exceed ADAPT_SHRINK_ERROR_RATE
+ADAPT_WINDOW = 128
+ADAPT_EVERY = 64
+ADAPT_GROW_ERROR_RATE = 0.02
+ADAPT_SHRINK_ERROR_RATE = 0.10
+ADAPT_P95_TOLERANCE = 1.25
+
+# URLs handed to a hunter per batch, so task and socket counts stay bounded
+HUNT_CHUNK_SIZE = 500
+
+
+# Coherence thresholds between tiers, and the tier at each np.digitize index
+_TIER_BINS = (0.4, 0.6, 0.8)
+_TIER_NAMES = ('disqualified', 'cold', 'warm', 'hot')
+
+# URLs hunted successfully within this long are not fetched or counted again
+HUNT_CACHE_SIZE = 1024
+HUNT_CACHE_TTL_SECONDS = 60
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire a fixed time after insertion"""
+
+    __slots__ = ('maxsize', 'ttl_ns', '_data')
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_ns = int(ttl_seconds * 1e9)
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_ns, value = item
+        if time.monotonic_ns() >= expires_ns:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic_ns() + self.ttl_ns, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _get_hunter() -> EnhancedWebHunter:
+    """The process-wide Crawl4AI hunter, shared by every trial run"""
+    return EnhancedWebHunter(
+        headless=True,
+        stealth_mode=True
+    )
+
+
+def _tier(coherence: float) -> str:
+    """Qualification tier for a hunt result's coherence score"""
+    if coherence >= 0.8:
+        return 'hot'
+    if coherence >= 0.6:
+        return 'warm'
+    if coherence >= 0.4:
+        return 'cold'
+    return 'disqualified'
+
+
+class _AdaptiveLimiter:
+    """
+    Concurrency cap tuned from observed request latency and errors.
+
+    Callers ``await acquire()`` before a request and ``release()`` with
+    its latency and whether it errored. The cap moves between
+    ``min_limit`` and ``max_limit``: +1 when the recent window looks
+    healthy, halved when too many requests fail.
+    """
+
+    __slots__ = ('limit', 'min_limit', 'max_limit', '_in_flight', '_waiters',
+                 '_window', '_completed', '_last_p95')
+
+    def __init__(self, limit: int, min_limit: int = 1, max_limit: Optional[int] = None):
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit or limit * 4
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._window: deque = deque(maxlen=ADAPT_WINDOW)  # (latency_ns, errored)
+        self._completed = 0
+        self._last_p95 = None
+
+    async def acquire(self):
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()  # pass the wake-up on
+                raise
+        self._in_flight += 1
+
+    def release(self, latency_ns: int, errored: bool):
+        self._in_flight -= 1
+        self._window.append((latency_ns, errored))
+        self._completed += 1
+        if self._completed % ADAPT_EVERY == 0:
+            self._adapt()
+        self._wake()
+
+    def _wake(self):
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _adapt(self):
+        latencies = sorted(latency for latency, _ in self._window)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        error_rate = sum(errored for _, errored in self._window) / len(self._window)
+
+        old = self.limit
+        if error_rate > ADAPT_SHRINK_ERROR_RATE:
+            self.limit = max(self.min_limit, self.limit // 2)
+        elif (error_rate < ADAPT_GROW_ERROR_RATE
+              and (self._last_p95 is None or p95 <= self._last_p95 * ADAPT_P95_TOLERANCE)):
+            self.limit = min(self.max_limit, self.limit + 1)
+        self._last_p95 = p95
+
+        if self.limit != old:
+            logger.info(
+                f"    Concurrency {old} → {self.limit} "
+                f"(p95 {p95 / 1e6:.0f} ms, {error_rate:.1%} errors)"
+            )
+
+
+class _BranchStats:
+    """
+    Running totals for one branch's hunt, updated per result.
+
+    State is O(1) in the number of URLs; coherence mean and variance use
+    Welford's online update, so no result needs to be kept around.
+    """
+
+    __slots__ = ('pages', 'succeeded', 'leads_found', 'coherence_mean', '_coherence_m2',
+                 'cached')
+
+    def __init__(self):
+        self.pages = 0
+        self.succeeded = 0
+        self.leads_found = 0
+        self.coherence_mean = 0.0
+        self._coherence_m2 = 0.0
+        self.cached = 0  # Skipped as recently hunted; not in the figures above
+
+    def add(self, result: HuntResult):
+        self.pages += 1
+        self.succeeded += result.success
+        self.leads_found += result.leads_found
+
+        delta = result.coherence_score - self.coherence_mean
+        self.coherence_mean += delta / self.pages
+        self._coherence_m2 += delta * (result.coherence_score - self.coherence_mean)
+
+    @property
+    def coherence_std(self) -> float:
+        return math.sqrt(self._coherence_m2 / self.pages) if self.pages else 0.0
+
+    def log(self, label: str, duration_ns: int):
+        """Log the branch summary (integer math on the ns duration)"""
+        n = self.pages
+        seconds, rem_ns = divmod(duration_ns, 1_000_000_000)
+        # Tenths of a page per minute, so slow branches keep a decimal place
+        tenths_per_min = n * 600_000_000_000 // max(duration_ns, 1)
+        logger.info(f"  ✓ {label} complete:")
+        logger.info(f"    Duration: {seconds}.{rem_ns // 10_000_000:02d}s")
+        logger.info(f"    Leads found: {self.leads_found}")
+        logger.info(f"    Success rate: {self.succeeded / n if n else 0.0:.1%}")
+        logger.info(f"    Avg coherence: {self.coherence_mean:.2f} (±{self.coherence_std:.2f})")
+        logger.info(f"    Speed: {tenths_per_min // 10}.{tenths_per_min % 10} pages/min")
+        if self.cached:
+            logger.info(f"    Skipped (hunted within {HUNT_CACHE_TTL_SECONDS}s): {self.cached}")
+
+
+def _failed_result(url: str, error: str, start_ns: int) -> HuntResult:
+    """Synthetic failed hunt, so aggregation never sees the exception"""
+    return HuntResult(
+        url=url,
+        leads_found=0,
+        raw_markdown="",
+        extracted_data=[],
+        coherence_score=0.0,
+        psi_content=0.0,
+        rho_authority=0.0,
+        q_freshness=0.0,
+        f_match=0.0,
+        hunt_time_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+        success=False,
+        error=error
+    )
+
+
+def _chunks(seq: Sequence[str], n: int) -> Iterator[Sequence[str]]:
+    """Consecutive slices of ``seq`` with at most ``n`` items each"""
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+def compile_schema(schema: Dict[str, Any]) -> tuple:
+    """
+    Compile a crawl4ai-style CSS schema's selectors once, for extract_css.
+
+    Returns (base selector, ((field name, selector, attribute or None), ...)).
+    """
+    return (
+        sv.compile(schema['baseSelector']),
+        tuple(
+            (spec['name'], sv.compile(spec['selector']),
+             spec['attribute'] if spec.get('type') == 'attribute' else None)
+            for spec in schema.get('fields', [])
+        ),
+    )
+
+
+def extract_css(html: str, compiled_schema: tuple) -> tuple[str, List[Dict[str, Any]]]:
+    """
+    Apply a compiled CSS schema (see compile_schema) to a page.
+
+    Returns (page text, records), where each record holds the schema
+    fields found under one ``baseSelector`` match.
+    """
+    base_selector, fields = compiled_schema
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    records = []
+
+    for base in base_selector.select(soup):
+        record = {}
+        for name, selector, attribute in fields:
+            el = selector.select_one(base)
+            if el is None:
+                continue
+            value = el.get(attribute) if attribute else el.get_text(' ', strip=True)
+            if value:
+                record[name] = value
+        if record:
+            records.append(record)
+
+    return soup.get_text('\n', strip=True), records
+
 
 class CrawlAIHunterTrial:
     """
@@ -51,10 +363,61 @@ class CrawlAIHunterTrial:
     - Equal or better stealth effectiveness
     """
 
+    __slots__ = (
+        'trial_manager', 'trial', '_session', '_hunter',
+        '_pending_quals', '_pending_outcomes', '_cache',
+    )
+
     def __init__(self):
         self.trial_manager = TrialManager()
         self.trial = None
 
+        # Shared HTTP session for the whole run, opened on first use
+        self._session = None
+
+        # Crawl4AI hunter whose browser this trial started (closed by aclose)
+        self._hunter = None
+
+        # Trial metrics waiting for one bulk write:
+        # (branch, coherence) and (branch, outcome_type, deal_value, cost)
+        self._pending_quals: List[tuple] = []
+        self._pending_outcomes: List[tuple] = []
+
+        # (branch, schema, url) of recent successful hunts
+        self._cache = _TTLCache(HUNT_CACHE_SIZE, HUNT_CACHE_TTL_SECONDS)
+
+    async def _ensure_session(self) -> 'aiohttp.ClientSession':
+        """
+        The run's HTTP session, created on first call.
+
+        Every request in the trial shares its connection pool and DNS
+        cache, so keep-alive connections are reused across hunts. Lookups
+        go through c-ares when aiodns is installed, otherwise through
+        aiohttp's default thread-pool resolver; neither blocks the loop.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+                    limit=50,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+                timeout=aiohttp.ClientTimeout(total=CLASSIC_TIMEOUT_SECONDS),
+                headers={'User-Agent': "RoseGlassCRM/1.0 (Lead Research Bot)"},
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the HTTP session and release the shared hunter (if started)"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._hunter is not None:
+            await self._hunter.close()
+            self._hunter = None
+
     def create_trial(self) -> str:
         """
         Create and configure the Crawl4AI hunter trial.
@@ -65,16 +428,16 @@ class CrawlAIHunterTrial:
         # Classic configuration (current approach)
         classic_config = {
             'hunter': 'classic_web_hunter',
-            'approach': 'requests_based',
+            'approach': 'aiohttp_css',
             'features': {
-                'async': False,
+                'async': True,
                 'stealth_mode': False,
                 'llm_extraction': False,
                 'css_extraction': True,
                 'dynamic_content': False,
             },
             'extraction_strategy': 'css_only',
-            'max_concurrent': 1,
+            'max_concurrent': CLASSIC_MAX_CONCURRENT,
             'expected_speed_ppm': 5,  # pages per minute
         }
 
@@ -95,7 +458,7 @@ class CrawlAIHunterTrial:
                 'stealth_mode': True,
             },
             'llm_provider': 'openai/gpt-4o-mini',
-            'max_concurrent': 5,
+            'max_concurrent': EXPERIMENTAL_MAX_CONCURRENT,
             'expected_speed_ppm': 50,  # 10x improvement target
         }
 
@@ -103,7 +466,7 @@ class CrawlAIHunterTrial:
             name="Crawl4AI Enhanced Hunting",
             description=(
                 "Test Crawl4AI async crawler with LLM extraction vs "
-                "classic requests-based scraping. Measures speed, accuracy, "
+                "classic aiohttp + CSS scraping. Measures speed, accuracy, "
                 "stealth, and data richness."
             ),
             experimental_config=experimental_config,
@@ -138,85 +501,209 @@ class CrawlAIHunterTrial:
 
         logger.info(f"\n🔍 Running hunt comparison on {len(test_urls)} URLs...")
 
-        # Initialize hunters
-        enhanced_hunter = EnhancedWebHunter(
-            headless=True,
-            stealth_mode=True
-        )
-
-        # For classic, we'd use the existing WebHunter
-        # For now, we'll simulate classic results
-
         # Run experimental hunt
         logger.info("\n▶️  EXPERIMENTAL: Crawl4AI Enhanced Hunter")
-        exp_start = time.time()
+        exp_start = time.perf_counter_ns()
 
         try:
-            exp_results = await enhanced_hunter.hunt_leads(
-                urls=test_urls,
-                extraction_schema=schema,
-                use_llm=False  # CSS first, LLM fallback if needed
-            )
-
-            exp_duration = time.time() - exp_start
-            exp_leads_found = sum(r.leads_found for r in exp_results)
-            exp_success_rate = sum(1 for r in exp_results if r.success) / len(exp_results)
-            exp_avg_coherence = sum(r.coherence_score for r in exp_results) / len(exp_results)
-
-            logger.info(f"  ✓ Experimental complete:")
-            logger.info(f"    Duration: {exp_duration:.2f}s")
-            logger.info(f"    Leads found: {exp_leads_found}")
-            logger.info(f"    Success rate: {exp_success_rate:.1%}")
-            logger.info(f"    Avg coherence: {exp_avg_coherence:.2f}")
-            logger.info(f"    Speed: {len(test_urls) / (exp_duration / 60):.1f} pages/min")
-
-            # Record to trial
-            for result in exp_results:
-                # Map hunt results to trial metrics
-                if result.success:
-                    # Tier based on coherence score
-                    if result.coherence_score >= 0.8:
-                        tier = 'hot'
-                    elif result.coherence_score >= 0.6:
-                        tier = 'warm'
-                    elif result.coherence_score >= 0.4:
-                        tier = 'cold'
-                    else:
-                        tier = 'disqualified'
-
-                    self.trial_manager.record_qualification(
-                        self.trial.trial_id,
-                        'experimental',
-                        tier
+            # One browser launch, reused by every URL until aclose(). The
+            # hunter is shared, so each trial holds (and releases) one start().
+            if self._hunter is None:
+                self._hunter = await _get_hunter().start()
+            enhanced_hunter = self._hunter
+            # Starts at the configured cap and adapts to how the pages respond
+            limiter = _AdaptiveLimiter(self.trial.experimental_branch.config['max_concurrent'])
+
+            async def hunt_one(url: str) -> HuntResult:
+                await limiter.acquire()
+                start_ns = time.perf_counter_ns()
+                result = None
+                try:
+                    result = (await asyncio.wait_for(
+                        enhanced_hunter.hunt_leads(
+                            urls=[url],
+                            extraction_schema=schema,
+                            use_llm=False  # CSS first, LLM fallback if needed
+                        ),
+                        timeout=HUNT_TIMEOUT_SECONDS
+                    ))[0]
+                    return result
+                except asyncio.TimeoutError:
+                    logger.error(f"❌ Experimental hunt timed out for {url}")
+                    result = _failed_result(url, 'timeout', start_ns)
+                    return result
+                finally:
+                    limiter.release(
+                        time.perf_counter_ns() - start_ns,
+                        result is None or result.error is not None
                     )
 
-                    # Record outcome (success = won)
-                    self.trial_manager.record_outcome(
-                        self.trial.trial_id,
-                        'experimental',
-                        outcome_type='won' if result.success else 'lost',
-                        deal_value=result.leads_found * 100,  # Value per lead
-                        cost=0  # No LLM cost if CSS only
-                    )
+            await self._run_branch(
+                'Experimental', 'experimental', test_urls, schema, hunt_one, exp_start
+            )
+            logger.info(f"    Tuned max_concurrent: {limiter.limit}")
 
         except Exception as e:
             logger.error(f"  ❌ Experimental hunt failed: {e}")
 
-        # For classic comparison, we'd run the same URLs through classic hunter
-        # Simulating classic results for now:
-        logger.info("\n▶️  CLASSIC: Traditional Web Hunter")
-        logger.info("  (Simulated results - integrate actual classic hunter)")
+        # Run the same URLs through the classic hunter
+        logger.info("\n▶️  CLASSIC: aiohttp + CSS Web Hunter")
+        classic_start = time.perf_counter_ns()
+
+        try:
+            hunt_one = await self._classic_hunter(schema)
+            await self._run_branch('Classic', 'classic', test_urls, schema, hunt_one, classic_start)
+
+        except Exception as e:
+            logger.error(f"  ❌ Classic hunt failed: {e}")
+
+    async def _classic_hunter(
+        self,
+        schema: Dict[str, Any]
+    ) -> Callable[[str], Awaitable[HuntResult]]:
+        """
+        Classic branch: plain HTTP fetch + CSS extraction, no browser.
+
+        Returns the per-URL hunt coroutine function. Fetches share the
+        run's session, with at most CLASSIC_MAX_CONCURRENT in flight.
+        """
+        if not (AIOHTTP_AVAILABLE and BS4_AVAILABLE):
+            raise ImportError(
+                "Classic hunter needs aiohttp and beautifulsoup4. "
+                "Run: pip install aiohttp beautifulsoup4 lxml"
+            )
+
+        session = await self._ensure_session()
+        sem = asyncio.Semaphore(CLASSIC_MAX_CONCURRENT)
+        compiled_schema = compile_schema(schema)
+
+        async def fetch(url: str) -> HuntResult:
+            start_ns = time.perf_counter_ns()
+            try:
+                async with sem:
+                    async with session.get(url) as resp:
+                        # Undecodable bytes become U+FFFD rather than failing the page
+                        html = await resp.text(errors='replace')
+                        ok = resp.status < 400
+                text, records = extract_css(html, compiled_schema)
+            except asyncio.TimeoutError:
+                logger.error(f"❌ Classic hunt timed out for {url}")
+                return _failed_result(url, 'timeout', start_ns)
+            except aiohttp.ClientError as e:
+                logger.error(f"❌ Classic hunt failed for {url}: {e}")
+                return _failed_result(url, str(e) or type(e).__name__, start_ns)
+            except Exception as e:  # Unknown charset, parser error, ...: fail this page only
+                logger.error(f"❌ Classic hunt failed for {url}: {type(e).__name__}: {e}")
+                return _failed_result(url, f"{type(e).__name__}: {e}", start_ns)
+
+            page = SimpleNamespace(markdown=text, html=html, success=ok, extracted_content=records)
+            psi, rho, q, f = page_dimensions(page, len(records), schema)
+
+            return HuntResult(
+                url=url,
+                leads_found=len(records),
+                raw_markdown=text,
+                extracted_data=records,
+                coherence_score=(psi + rho + q + f) / 4.0,
+                psi_content=psi,
+                rho_authority=rho,
+                q_freshness=q,
+                f_match=f,
+                hunt_time_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                success=ok
+            )
+
+        return fetch
 
-        # Simulate classic being slower but similar accuracy
-        classic_duration = exp_duration * 5  # 5x slower
-        classic_leads = int(exp_leads_found * 0.9)  # 90% as accurate
-        classic_success_rate = exp_success_rate * 0.8  # 80% success (less stealth)
+    async def _run_branch(
+        self,
+        label: str,
+        branch: str,
+        urls: Sequence[str],
+        schema: Dict[str, Any],
+        hunt_one: Callable[[str], Awaitable[HuntResult]],
+        start_ns: int
+    ):
+        """
+        Hunt ``urls`` for one branch, recording each result as it lands.
+
+        URLs go out in HUNT_CHUNK_SIZE batches. URLs hunted successfully
+        within HUNT_CACHE_TTL_SECONDS are skipped, and counted apart from
+        the trial's samples and timing; the rest are taken in completion
+        order, so recording overlaps the slower fetches. Buffered trial
+        metrics are flushed after every batch.
+        """
+        schema_key = json.dumps(schema, sort_keys=True)
+        stats = _BranchStats()
 
-        logger.info(f"  ✓ Classic complete:")
-        logger.info(f"    Duration: {classic_duration:.2f}s (simulated)")
-        logger.info(f"    Leads found: {classic_leads} (simulated)")
-        logger.info(f"    Success rate: {classic_success_rate:.1%} (simulated)")
-        logger.info(f"    Speed: {len(test_urls) / (classic_duration / 60):.1f} pages/min")
+        try:
+            for batch, chunk in enumerate(_chunks(urls, HUNT_CHUNK_SIZE), 1):
+                pages, succeeded = stats.pages, stats.succeeded
+
+                misses = [
+                    url for url in chunk
+                    if self._cache.get((branch, schema_key, url)) is None
+                ]
+                if len(misses) < len(chunk):
+                    stats.cached += len(chunk) - len(misses)
+                    logger.info(f"    Cache hits: {len(chunk) - len(misses)}/{len(chunk)}")
+
+                tasks = [asyncio.create_task(hunt_one(url)) for url in misses]
+                try:
+                    for next_result in asyncio.as_completed(tasks):
+                        result = await next_result
+                        # Only successes are cached, so failed URLs are retried next run
+                        if result.success:
+                            self._cache[(branch, schema_key, result.url)] = True
+                        self._record_one(stats, branch, result)
+                finally:
+                    # On cancellation (e.g. a timeout) or error, no hunt may
+                    # outlive the branch and run on into aclose()
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+                logger.info(
+                    f"    Batch {batch}: {stats.succeeded - succeeded}/"
+                    f"{stats.pages - pages} succeeded"
+                )
+                self._flush_pending()
+        finally:
+            self._flush_pending()
+
+        stats.log(label, time.perf_counter_ns() - start_ns)
+
+    def _record_one(self, stats: _BranchStats, branch: str, result: HuntResult):
+        """Fold one hunt result into the branch totals and metric buffers"""
+        stats.add(result)
+        if result.success:
+            self._pending_quals.append((branch, result.coherence_score))
+
+            # Record outcome (success = won); value per lead, no LLM cost if CSS only
+            self._pending_outcomes.append((branch, 'won', result.leads_found * 100, 0))
+
+    def _flush_pending(self):
+        """
+        Write buffered qualifications and outcomes to the trial manager.
+
+        Tiers for the buffered coherence scores are assigned here in one
+        np.digitize call (per-score _tier() without numpy).
+        """
+        if self._pending_quals:
+            branches, coherences = zip(*self._pending_quals)
+            self._pending_quals.clear()
+            if NUMPY_AVAILABLE:
+                tiers = np.asarray(_TIER_NAMES)[np.digitize(coherences, _TIER_BINS)].tolist()
+            else:
+                tiers = [_tier(c) for c in coherences]
+            self.trial_manager.record_qualifications_bulk(self.trial.trial_id, branches, tiers)
+
+        if self._pending_outcomes:
+            branches, outcome_types, deal_values, costs = zip(*self._pending_outcomes)
+            self._pending_outcomes.clear()
+            self.trial_manager.record_outcomes_bulk(
+                self.trial.trial_id, branches, outcome_types, deal_values, costs
+            )
 
     def evaluate(self) -> str:
         """
@@ -282,8 +769,18 @@ async def demo_trial():
     print("\n🧪 Running hunt comparison...")
     print(f"  Testing {len(test_urls)} URLs")
 
-    # Run comparison
-    await trial.run_hunt_comparison(test_urls)
+    # Run comparison, bounded so one hung URL cannot stall the run
+    # (asyncio.wait_for rather than asyncio.timeout: Python 3.10 is supported).
+    # On timeout the cancellation reaches every in-flight hunt, and wait_for
+    # returns only once they have stopped, so aclose() never pulls the
+    # session or browser out from under one.
+    timeout = max(len(test_urls) * TRIAL_SECONDS_PER_URL, TRIAL_MIN_TIMEOUT_SECONDS)
+    try:
+        await asyncio.wait_for(trial.run_hunt_comparison(test_urls), timeout=timeout)
+    except asyncio.TimeoutError:
+        print(f"\n⏱️  Hunt comparison timed out after {timeout}s - evaluating partial results")
+    finally:
+        await trial.aclose()
 
     # Evaluate
     print("\n📊 Evaluating trial...")
@@ -345,17 +842,23 @@ def integrate_with_web_hunter():
 
 
 if __name__ == "__main__":
-    # Check dependencies
+    # Check dependencies from installed metadata, without importing crawl4ai
     try:
-        from integrations.crawl4ai_hunter.enhanced_web_hunter import EnhancedWebHunter
-
-        # Run demo
-        asyncio.run(demo_trial())
-
-    except ImportError as e:
+        metadata.version('crawl4ai')
+    except metadata.PackageNotFoundError as e:
         print(f"\n⚠️  Dependencies not installed:")
         print(f"   {e}")
         print(f"\nInstall with:")
+        print(f"   pip install -e .  # from the repo root")
         print(f"   pip install crawl4ai playwright pydantic")
         print(f"   playwright install")
-        print(f"\nThen run: python trials/crawl4ai_hunter_trial.py")
+        print(f"   pip install uvloop  # optional, faster event loop")
+        print(f"\nThen run: python -m trials.crawl4ai_hunter_trial")
+    else:
+        # libuv event loop when available (set here, not on import, so
+        # importing the trial never changes the caller's loop policy)
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        # Run demo
+        asyncio.run(demo_trial())